@@ -1,6 +1,6 @@
 import streamlit as st
 from config.settings import setup_page_config
-from database.connection import init_connection, init_db
+from database.connection import init_connection
 from pages.login.login_page import display_login
 from pages.admin.dashboard import admin_dashboard
 from pages.company.dashboard import company_dashboard
@@ -19,9 +19,6 @@ def main():
     engine = init_connection()
     
     if engine:
-        # Initialize database tables if they don't exist
-        init_db(engine)
-
         # Check if user is logged in
         if "user" not in st.session_state:
             display_login(engine)
@@ -1,5 +1,5 @@
 import streamlit as st
-from styles.custom_css import get_custom_css
+from styles.custom_css import CUSTOM_CSS_HTML
 
 def setup_page_config():
     """Configure the Streamlit page settings"""
@@ -12,4 +12,4 @@ def setup_page_config():
     )
     
     # Apply custom CSS
-    st.markdown(get_custom_css(), unsafe_allow_html=True)
\ No newline at end of file
+    st.markdown(CUSTOM_CSS_HTML, unsafe_allow_html=True)
\ No newline at end of file
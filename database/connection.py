@@ -1,3 +1,52 @@
+import streamlit as st
+from sqlalchemy import create_engine, text
+from utils.auth import hash_password
+
+# Pool sizing for concurrent Streamlit sessions: keep up to 10 connections
+# open (30 under load), check a connection is alive before handing it out
+# and replace connections older than 30 minutes before the server drops them.
+ENGINE_POOL_OPTIONS = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+
+@st.cache_resource
+def get_engine():
+    """Create the shared SQLAlchemy engine.
+    
+    Cached with st.cache_resource so every rerun and every session reuses
+    one connection pool instead of building a new engine. The schema is
+    initialized once, when the engine is first created.
+    
+    The returned engine is shared by all sessions; callers must not mutate
+    it (e.g. dispose it or change its options).
+    
+    Returns:
+        SQLAlchemy database engine
+    """
+    engine = create_engine(
+        st.secrets["postgres"]["url"],
+        # Send executemany() parameter lists as multi-row VALUES batches
+        executemany_mode="values_plus_batch",
+        **ENGINE_POOL_OPTIONS
+    )
+    init_db(engine)
+    return engine
+
+def init_connection():
+    """Get the database engine.
+    
+    Returns:
+        SQLAlchemy database engine, or None if the connection failed
+    """
+    try:
+        return get_engine()
+    except Exception as e:
+        st.error(f"Database connection error: {e}")
+        return None
+
 def init_db(engine):
     """Initialize database tables if they don't exist.
     
@@ -156,3 +205,60 @@ def init_db(engine):
         WHERE e.branch_id = b.id AND r.role_name = 'General Employee' AND e.role_id IS NULL;
         '''))
         conn.commit()
+        
+        # One report per employee per day. The first time, before the unique
+        # index exists, fold the text of any duplicates into the newest of
+        # them, oldest first, and delete the rest so the index can be built
+        has_unique_index = conn.execute(text('''
+        SELECT 1 FROM pg_indexes
+        WHERE tablename = 'daily_reports' AND indexname = 'daily_reports_emp_date_key'
+        ''')).fetchone()
+        if not has_unique_index:
+            conn.execute(text('''
+            UPDATE daily_reports dr
+            SET report_text = merged.report_text
+            FROM (
+                SELECT MAX(id) AS keep_id,
+                       string_agg(report_text, E'\\n\\n' ORDER BY id) AS report_text
+                FROM daily_reports
+                GROUP BY employee_id, report_date
+                HAVING COUNT(*) > 1
+            ) merged
+            WHERE dr.id = merged.keep_id;
+            
+            DELETE FROM daily_reports dr
+            USING daily_reports newer
+            WHERE newer.employee_id = dr.employee_id
+              AND newer.report_date = dr.report_date
+              AND newer.id > dr.id;
+            
+            CREATE UNIQUE INDEX daily_reports_emp_date_key ON daily_reports(employee_id, report_date);
+            '''))
+            conn.commit()
+        
+        # Indexes for the dashboard report and task queries
+        conn.execute(text('''
+        CREATE INDEX IF NOT EXISTS idx_employees_branch_role ON employees(branch_id, role_id);
+        CREATE INDEX IF NOT EXISTS idx_tasks_emp_completed_due ON tasks(employee_id, is_completed, due_date);
+        '''))
+        conn.commit()
+        
+        # Indexes for the foreign keys that login and company pages join on
+        conn.execute(text('''
+        CREATE INDEX IF NOT EXISTS idx_branches_company ON branches(company_id);
+        CREATE INDEX IF NOT EXISTS idx_employees_role ON employees(role_id);
+        '''))
+        conn.commit()
+        
+        # Hash any passwords still stored in plaintext
+        for table in ("companies", "employees"):
+            rows = conn.execute(text(f'''
+            SELECT id, password FROM {table} WHERE password NOT LIKE '$2%'
+            ''')).fetchall()
+            
+            if rows:
+                conn.execute(
+                    text(f'UPDATE {table} SET password = :password WHERE id = :id'),
+                    [{'id': row[0], 'password': hash_password(row[1])} for row in rows]
+                )
+                conn.commit()
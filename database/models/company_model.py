@@ -1,4 +1,5 @@
 from sqlalchemy import text
+from utils.auth import hash_password, check_password
 
 class CompanyModel:
     """Company data operations"""
@@ -44,7 +45,7 @@ class CompanyModel:
         '''), {
             'company_name': company_name,
             'username': username,
-            'password': password,
+            'password': hash_password(password),
             'profile_pic_url': profile_pic_url if profile_pic_url else default_pic
         })
         conn.commit()
@@ -76,7 +77,7 @@ class CompanyModel:
     def reset_password(conn, company_id, new_password):
         """Reset a company's password."""
         conn.execute(text('UPDATE companies SET password = :password WHERE id = :id'), 
-                    {'id': company_id, 'password': new_password})
+                    {'id': company_id, 'password': hash_password(new_password)})
         conn.commit()
     
     @staticmethod
@@ -97,8 +98,7 @@ class CompanyModel:
     def verify_password(conn, company_id, current_password):
         """Verify company's current password."""
         result = conn.execute(text('''
-        SELECT COUNT(*)
-        FROM companies
-        WHERE id = :company_id AND password = :current_password
-        '''), {'company_id': company_id, 'current_password': current_password})
-        return result.fetchone()[0] > 0
\ No newline at end of file
+        SELECT password FROM companies WHERE id = :company_id
+        '''), {'company_id': company_id})
+        row = result.fetchone()
+        return row is not None and check_password(current_password, row[0])
\ No newline at end of file
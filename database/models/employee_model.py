@@ -1,4 +1,5 @@
 from sqlalchemy import text
+from utils.auth import hash_password, check_password
 
 class EmployeeModel:
     """Employee data operations"""
@@ -142,7 +143,7 @@ class EmployeeModel:
             'branch_id': branch_id,
             'role_id': role_id,
             'username': username,
-            'password': password,
+            'password': hash_password(password),
             'full_name': full_name,
             'profile_pic_url': profile_pic_url if profile_pic_url else default_pic
         })
@@ -209,7 +210,7 @@ class EmployeeModel:
             new_password: New password
         """
         conn.execute(text('UPDATE employees SET password = :password WHERE id = :id'), 
-                    {'id': employee_id, 'password': new_password})
+                    {'id': employee_id, 'password': hash_password(new_password)})
         conn.commit()
     
     @staticmethod
@@ -246,8 +247,7 @@ class EmployeeModel:
             bool: True if password matches, False otherwise
         """
         result = conn.execute(text('''
-        SELECT COUNT(*)
-        FROM employees
-        WHERE id = :employee_id AND password = :current_password
-        '''), {'employee_id': employee_id, 'current_password': current_password})
-        return result.fetchone()[0] > 0
\ No newline at end of file
+        SELECT password FROM employees WHERE id = :employee_id
+        '''), {'employee_id': employee_id})
+        row = result.fetchone()
+        return row is not None and check_password(current_password, row[0])
@@ -25,6 +25,37 @@ class ReportModel:
         '''), {'employee_id': employee_id, 'start_date': start_date, 'end_date': end_date})
         return result.fetchall()
     
+    @staticmethod
+    def get_employee_reports_grouped(conn, employee_id, start_date, end_date):
+        """Get an employee's reports within a date range, grouped by month.
+        
+        Args:
+            conn: Database connection
+            employee_id: ID of the employee
+            start_date: Start date for filtering
+            end_date: End date for filtering
+            
+        Returns:
+            List of (period, report_count, reports) rows, newest month first.
+            reports is a list of dicts with id, date (ISO string),
+            display_date (e.g. 'Monday, 05 Jan 2026') and text, newest first.
+        """
+        result = conn.execute(text('''
+        SELECT to_char(date_trunc('month', report_date), 'FMMonth YYYY') AS period,
+               COUNT(*) AS report_count,
+               json_agg(json_build_object(
+                   'id', id, 'date', report_date,
+                   'display_date', to_char(report_date, 'FMDay, DD Mon YYYY'),
+                   'text', report_text
+               ) ORDER BY report_date DESC) AS reports
+        FROM daily_reports
+        WHERE employee_id = :employee_id
+        AND report_date BETWEEN :start_date AND :end_date
+        GROUP BY date_trunc('month', report_date)
+        ORDER BY date_trunc('month', report_date) DESC
+        '''), {'employee_id': employee_id, 'start_date': start_date, 'end_date': end_date})
+        return result.fetchall()
+    
     @staticmethod
     def get_branch_reports(conn, branch_id, start_date, end_date, role_id=None):
         """Get reports for all employees in a branch within a date range.
@@ -37,10 +68,12 @@ class ReportModel:
             role_id: Optional role ID for filtering
             
         Returns:
-            List of reports with employee info
+            List of reports with employee info, grouped by employee (in role
+            order) and newest first within each employee. The employee ID
+            is last, to tell apart employees who share a name.
         """
         query = '''
-        SELECT dr.id, e.full_name, r.role_name, dr.report_date, dr.report_text, dr.created_at
+        SELECT dr.id, e.full_name, r.role_name, dr.report_date, dr.report_text, dr.created_at, e.id AS employee_id
         FROM daily_reports dr
         JOIN employees e ON dr.employee_id = e.id
         JOIN employee_roles r ON e.role_id = r.id
@@ -58,7 +91,7 @@ class ReportModel:
             query += ' AND e.role_id = :role_id'
             params['role_id'] = role_id
         
-        query += ' ORDER BY dr.report_date DESC, r.role_level, e.full_name'
+        query += ' ORDER BY r.role_level, e.full_name, e.id, dr.report_date DESC'
         
         result = conn.execute(text(query), params)
         return result.fetchall()
@@ -76,10 +109,12 @@ class ReportModel:
             role_id: Optional role ID for filtering
             
         Returns:
-            List of reports with employee and branch info
+            List of reports with employee and branch info, grouped by branch
+            and employee and newest first within each employee. The employee
+            ID is last, to tell apart employees who share a name.
         """
         query = '''
-        SELECT dr.id, e.full_name, r.role_name, b.branch_name, dr.report_date, dr.report_text, dr.created_at
+        SELECT dr.id, e.full_name, r.role_name, b.branch_name, dr.report_date, dr.report_text, dr.created_at, e.id AS employee_id
         FROM daily_reports dr
         JOIN employees e ON dr.employee_id = e.id
         JOIN branches b ON e.branch_id = b.id
@@ -102,7 +137,7 @@ class ReportModel:
             query += ' AND e.role_id = :role_id'
             params['role_id'] = role_id
         
-        query += ' ORDER BY dr.report_date DESC, b.branch_name, r.role_level, e.full_name'
+        query += ' ORDER BY b.branch_name, r.role_level, e.full_name, e.id, dr.report_date DESC'
         
         result = conn.execute(text(query), params)
         return result.fetchall()
@@ -138,26 +173,6 @@ class ReportModel:
         result = conn.execute(text(query), params)
         return result.fetchall()
     
-    @staticmethod
-    def add_report(conn, employee_id, report_date, report_text):
-        """Add a new report.
-        
-        Args:
-            conn: Database connection
-            employee_id: ID of the employee
-            report_date: Date of the report
-            report_text: Content of the report
-        """
-        conn.execute(text('''
-        INSERT INTO daily_reports (employee_id, report_date, report_text)
-        VALUES (:employee_id, :report_date, :report_text)
-        '''), {
-            'employee_id': employee_id,
-            'report_date': report_date,
-            'report_text': report_text
-        })
-        conn.commit()
-    
     @staticmethod
     def update_report(conn, report_id, report_date, report_text):
         """Update an existing report.
@@ -167,35 +182,56 @@ class ReportModel:
             report_id: ID of the report
             report_date: New date for the report
             report_text: New content for the report
+            
+        Returns:
+            bool: True if the report was updated, False if the employee
+                already has another report for report_date
         """
-        conn.execute(text('''
-        UPDATE daily_reports 
+        result = conn.execute(text('''
+        UPDATE daily_reports dr
         SET report_text = :report_text, report_date = :report_date, created_at = CURRENT_TIMESTAMP
         WHERE id = :id
+          AND NOT EXISTS (
+              SELECT 1 FROM daily_reports other
+              WHERE other.employee_id = dr.employee_id
+                AND other.report_date = :report_date
+                AND other.id <> dr.id
+          )
         '''), {
             'report_text': report_text,
             'report_date': report_date,
             'id': report_id
         })
         conn.commit()
+        return result.rowcount > 0
     
     @staticmethod
-    def check_report_exists(conn, employee_id, report_date):
-        """Check if a report already exists for the given date.
+    def upsert_report(conn, employee_id, report_date, report_text):
+        """Add a report, or replace the employee's report for that date.
+        
+        Does not commit; run it inside the caller's transaction.
         
         Args:
             conn: Database connection
             employee_id: ID of the employee
-            report_date: Date to check
+            report_date: Date of the report
+            report_text: Content of the report
             
         Returns:
-            Report ID if exists, None otherwise
+            bool: True if a new report was added, False if one was updated
         """
         result = conn.execute(text('''
-        SELECT id FROM daily_reports 
-        WHERE employee_id = :employee_id AND report_date = :report_date
-        '''), {'employee_id': employee_id, 'report_date': report_date})
-        return result.fetchone()
+        INSERT INTO daily_reports (employee_id, report_date, report_text)
+        VALUES (:employee_id, :report_date, :report_text)
+        ON CONFLICT (employee_id, report_date)
+        DO UPDATE SET report_text = EXCLUDED.report_text, created_at = CURRENT_TIMESTAMP
+        RETURNING (xmax = 0) AS inserted
+        '''), {
+            'employee_id': employee_id,
+            'report_date': report_date,
+            'report_text': report_text
+        })
+        return result.fetchone()[0]
     
     @staticmethod
     def generate_report_pdf(reports, report_type="employee"):
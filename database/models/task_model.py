@@ -1,5 +1,6 @@
 from sqlalchemy import text
 import datetime
+from utils.role_permissions import RolePermissions
 
 class TaskModel:
     """Task data operations with branch and employee assignment support"""
@@ -43,15 +44,15 @@ class TaskModel:
                 WHERE branch_id = :branch_id AND is_active = TRUE
                 '''), {'branch_id': branch_id}).fetchall()
                 
-                # Create task assignments for each employee
-                for emp in employees:
+                # Create task assignments for each employee in one executemany
+                if employees:
                     conn.execute(text('''
                     INSERT INTO task_assignments (task_id, employee_id, is_completed)
                     VALUES (:task_id, :employee_id, FALSE)
-                    '''), {
-                        'task_id': task_id,
-                        'employee_id': emp[0]
-                    })
+                    '''), [
+                        {'task_id': task_id, 'employee_id': emp[0]}
+                        for emp in employees
+                    ])
             
             return task_id
     
@@ -249,6 +250,60 @@ class TaskModel:
             
             return False
     
+    @staticmethod
+    def bulk_complete(conn, employee_id, task_ids):
+        """Mark several tasks as completed by an employee at once.
+        
+        Applies the same rules as mark_task_completed to every task: direct
+        tasks are completed, and for branch tasks the employee's assignment
+        is completed. A branch task is then completed once all its
+        assignments are done, or straight away for a Manager or Asst. Manager.
+        
+        Args:
+            conn: Database connection
+            employee_id: ID of the employee completing the tasks
+            task_ids: IDs of the tasks
+        """
+        params = {
+            'task_ids': list(task_ids),
+            'employee_id': employee_id,
+            'now': datetime.datetime.now(),
+            'asst_manager_level': RolePermissions.ASST_MANAGER
+        }
+        
+        with conn.begin():
+            # Direct tasks assigned to this employee
+            conn.execute(text('''
+            UPDATE tasks
+            SET is_completed = TRUE, completed_at = :now, completed_by_id = :employee_id
+            WHERE id = ANY(:task_ids) AND employee_id = :employee_id AND is_completed = FALSE
+            '''), params)
+            
+            # The employee's assignments for branch tasks
+            conn.execute(text('''
+            UPDATE task_assignments
+            SET is_completed = TRUE, completed_at = :now
+            WHERE task_id = ANY(:task_ids) AND employee_id = :employee_id AND is_completed = FALSE
+            '''), params)
+            
+            # Branch tasks that are now complete
+            conn.execute(text('''
+            UPDATE tasks t
+            SET is_completed = TRUE, completed_at = :now, completed_by_id = :employee_id
+            WHERE t.id = ANY(:task_ids) AND t.branch_id IS NOT NULL AND t.is_completed = FALSE
+              AND (
+                  NOT EXISTS (
+                      SELECT 1 FROM task_assignments ta
+                      WHERE ta.task_id = t.id AND ta.is_completed = FALSE
+                  )
+                  OR EXISTS (
+                      SELECT 1 FROM employees e
+                      JOIN employee_roles r ON e.role_id = r.id
+                      WHERE e.id = :employee_id AND r.role_level <= :asst_manager_level
+                  )
+              )
+            '''), params)
+    
     @staticmethod
     def get_tasks_for_employee(conn, employee_id, status_filter=None):
         """Get tasks assigned to an employee.
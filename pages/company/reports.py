@@ -79,7 +79,7 @@ def view_company_reports(engine, company_id, company_name):
     
     # Display report stats
     total_reports = len(reports)
-    unique_employees = len(set(r[1] for r in reports))  # Unique employee names
+    unique_employees = len(set(r[7] for r in reports))  # Unique employee IDs
     unique_branches = len(set(r[3] for r in reports))  # Unique branch names
     
     st.write(f"Found {total_reports} reports from {unique_employees} employees across {unique_branches} branches.")
@@ -107,27 +107,23 @@ def view_company_reports(engine, company_id, company_name):
         if branch_name not in reports_by_branch:
             reports_by_branch[branch_name] = {}
         
-        employee_name = report[1]
-        if employee_name not in reports_by_branch[branch_name]:
-            reports_by_branch[branch_name][employee_name] = []
+        # Key on the employee ID, since two employees can share a name
+        employee_id = report[7]
+        if employee_id not in reports_by_branch[branch_name]:
+            reports_by_branch[branch_name][employee_id] = []
         
-        reports_by_branch[branch_name][employee_name].append(report)
+        reports_by_branch[branch_name][employee_id].append(report)
     
     # Display branches
     for branch_name, employees in reports_by_branch.items():
         with st.expander(f"Branch: {branch_name} ({sum(len(reports) for reports in employees.values())} reports)", expanded=False):
             # Display employees in this branch
-            for employee_name, emp_reports in employees.items():
-                with st.expander(f"{employee_name} ({len(emp_reports)} reports)", expanded=False):
-                    # Group by date
-                    emp_reports_by_date = {}
+            for emp_reports in employees.values():
+                with st.expander(f"{emp_reports[0][1]} ({len(emp_reports)} reports)", expanded=False):
+                    # Display each report; an employee has at most one per
+                    # date and they arrive newest first
                     for report in emp_reports:
                         date = report[4]
-                        if date not in emp_reports_by_date:
-                            emp_reports_by_date[date] = report
-                    
-                    # Display each date
-                    for date, report in sorted(emp_reports_by_date.items(), key=lambda x: x[0], reverse=True):
                         report_text = report[5]
                         
                         st.markdown(f'''
@@ -193,7 +189,7 @@ def view_branch_reports(engine, company_id, company_name):
     
     # Display report stats
     total_reports = len(reports)
-    unique_employees = len(set(r[1] for r in reports))  # Unique employee names
+    unique_employees = len(set(r[6] for r in reports))  # Unique employee IDs
     
     st.write(f"Found {total_reports} reports from {unique_employees} employees in {selected_branch}.")
     
@@ -215,20 +211,21 @@ def view_branch_reports(engine, company_id, company_name):
     # Display reports grouped by employee
     reports_by_employee = {}
     for report in reports:
-        employee_name = report[1]
-        role_name = report[2]
-        key = f"{employee_name} ({role_name})"
+        # Key on the employee ID, since two employees can share a name
+        employee_id = report[6]
         
-        if key not in reports_by_employee:
-            reports_by_employee[key] = []
+        if employee_id not in reports_by_employee:
+            reports_by_employee[employee_id] = []
         
-        reports_by_employee[key].append(report)
+        reports_by_employee[employee_id].append(report)
     
     # Display employees
-    for employee, emp_reports in reports_by_employee.items():
-        with st.expander(f"{employee} ({len(emp_reports)} reports)", expanded=False):
-            # Display each report
-            for report in sorted(emp_reports, key=lambda x: x[3], reverse=True):
+    for emp_reports in reports_by_employee.values():
+        employee_name = emp_reports[0][1]
+        role_name = emp_reports[0][2]
+        with st.expander(f"{employee_name} ({role_name}) ({len(emp_reports)} reports)", expanded=False):
+            # Display each report, already newest first
+            for report in emp_reports:
                 report_date = report[3]
                 report_text = report[4]
                 
@@ -295,7 +292,7 @@ def view_role_reports(engine, company_id, company_name):
     
     # Display report stats
     total_reports = len(reports)
-    unique_employees = len(set(r[1] for r in reports))  # Unique employee names
+    unique_employees = len(set(r[7] for r in reports))  # Unique employee IDs
     unique_branches = len(set(r[3] for r in reports))  # Unique branch names
     
     st.write(f"Found {total_reports} reports from {unique_employees} {selected_role}s across {unique_branches} branches.")
@@ -323,20 +320,21 @@ def view_role_reports(engine, company_id, company_name):
         if branch_name not in reports_by_branch:
             reports_by_branch[branch_name] = {}
         
-        employee_name = report[1]
-        if employee_name not in reports_by_branch[branch_name]:
-            reports_by_branch[branch_name][employee_name] = []
+        # Key on the employee ID, since two employees can share a name
+        employee_id = report[7]
+        if employee_id not in reports_by_branch[branch_name]:
+            reports_by_branch[branch_name][employee_id] = []
         
-        reports_by_branch[branch_name][employee_name].append(report)
+        reports_by_branch[branch_name][employee_id].append(report)
     
     # Display branches
     for branch_name, employees in reports_by_branch.items():
         with st.expander(f"Branch: {branch_name} ({sum(len(reports) for reports in employees.values())} reports)", expanded=False):
             # Display employees in this branch
-            for employee_name, emp_reports in employees.items():
-                with st.expander(f"{employee_name} ({len(emp_reports)} reports)", expanded=False):
-                    # Display each report
-                    for report in sorted(emp_reports, key=lambda x: x[4], reverse=True):
+            for emp_reports in employees.values():
+                with st.expander(f"{emp_reports[0][1]} ({len(emp_reports)} reports)", expanded=False):
+                    # Display each report, already newest first
+                    for report in emp_reports:
                         report_date = report[4]
                         report_text = report[5]
                         
@@ -425,8 +423,8 @@ def view_employee_reports(engine, company_id):
             mime="application/pdf"
         )
     
-    # Display reports
-    for report in sorted(reports, key=lambda x: x[1], reverse=True):
+    # Display reports, already newest first
+    for report in reports:
         report_date = report[1]
         report_text = report[2]
         
@@ -1,9 +1,318 @@
 import streamlit as st
 from sqlalchemy import text
 import datetime
-import time
+import html
 from datetime import timedelta
+from database.models.report_model import ReportModel
+from utils.auth import hash_password
+from utils.helpers import get_date_range_from_filter
 from utils.role_permissions import RolePermissions
+from pages.employee.profile import edit_my_profile
+
+# is_completed value for each task status filter; None matches every task
+_TASK_STATUS = {"All Tasks": None, "Pending": False, "Completed": True}
+
+# Number of rows shown per page in the employee and task lists
+_PAGE_SIZE = 25
+
+# Number of report days shown per page in the branch report list
+_REPORT_DAYS_PAGE_SIZE = 30
+
+# HTML for the report and task cards; values must be escaped before formatting
+_REPORT_TMPL = """<div class="report-item">
+<div><strong>{name}</strong> ({role})</div>
+<p>{text}</p>
+</div>"""
+
+_RECENT_REPORT_TMPL = """<div class="report-item">
+<div><strong>{name}</strong> ({role}) - {date}</div>
+<p>{text}{ellipsis}</p>
+</div>"""
+
+_MY_REPORT_TMPL = """<div class="report-item">
+<div><strong>{date}</strong></div>
+<p>{text}</p>
+</div>"""
+
+_MY_TASK_TMPL = """<div class="task-item {status_class}">
+<div style="display: flex; justify-content: space-between;">
+<span><strong>#{number} Due:</strong> {due_date}</span>
+<span style="font-weight: 600; color: {status_color};">{status}</span>
+</div>
+<p>{description}</p>
+</div>"""
+
+_TASK_TMPL = """<div class="task-item {status_class}">
+<div style="display: flex; justify-content: space-between;">
+<span><strong>#{number} Assigned to:</strong> {assigned_to} ({role})</span>
+<span><strong>Due:</strong> {due_date}</span>
+</div>
+<p>{description}</p>
+<div style="text-align: right; font-weight: 600; color: {status_color};">{status}</div>
+</div>"""
+
+# Statements used by the dashboard, compiled once at import
+_Q_EMPLOYEE_DETAILS = text('''
+SELECT e.id, e.full_name, e.username, e.profile_pic_url, 
+       b.id as branch_id, b.branch_name, 
+       r.id as role_id, r.role_name, r.role_level
+FROM employees e
+JOIN branches b ON e.branch_id = b.id
+JOIN employee_roles r ON e.role_id = r.id
+WHERE e.id = :employee_id
+''')
+
+# Dashboard statistics, one round trip per role: pending tasks, today's
+# reports by the viewer and (for managers) active employees
+_Q_STATS_MANAGER = text('''
+SELECT
+    (SELECT COUNT(*) FROM tasks 
+     WHERE branch_id = :branch_id AND is_completed = FALSE) AS pending_tasks,
+    (SELECT COUNT(*) FROM daily_reports 
+     WHERE employee_id = :employee_id AND report_date = :today) AS todays_reports,
+    (SELECT COUNT(*) FROM employees 
+     WHERE branch_id = :branch_id AND is_active = TRUE) AS employee_count
+''')
+
+_Q_STATS_ASST_MANAGER = text('''
+SELECT
+    (SELECT COUNT(*) FROM tasks 
+     WHERE (employee_id IN (
+         SELECT id FROM employees WHERE branch_id = :branch_id AND role_id IN (
+             SELECT id FROM employee_roles WHERE role_level = :general_level
+         )
+     ) OR employee_id = :employee_id) AND is_completed = FALSE) AS pending_tasks,
+    (SELECT COUNT(*) FROM daily_reports 
+     WHERE employee_id = :employee_id AND report_date = :today) AS todays_reports,
+    (SELECT COUNT(*) FROM employees e
+     JOIN employee_roles r ON e.role_id = r.id
+     WHERE e.branch_id = :branch_id AND e.is_active = TRUE 
+     AND r.role_level = :general_level) AS employee_count
+''')
+
+_Q_STATS_OWN = text('''
+SELECT
+    (SELECT COUNT(*) FROM tasks 
+     WHERE employee_id = :employee_id AND is_completed = FALSE) AS pending_tasks,
+    (SELECT COUNT(*) FROM daily_reports 
+     WHERE employee_id = :employee_id AND report_date = :today) AS todays_reports,
+    NULL AS employee_count
+''')
+
+_Q_RECENT_REPORTS_BRANCH = text('''
+SELECT e.full_name, r.role_name, dr.report_date,
+       LEFT(dr.report_text, 150) AS report_text,
+       LENGTH(dr.report_text) > 150 AS is_truncated
+FROM daily_reports dr
+JOIN employees e ON dr.employee_id = e.id
+JOIN employee_roles r ON e.role_id = r.id
+WHERE e.branch_id = :branch_id
+ORDER BY dr.created_at DESC
+LIMIT 3
+''')
+
+_Q_RECENT_REPORTS_ASST_MANAGER = text('''
+SELECT e.full_name, r.role_name, dr.report_date,
+       LEFT(dr.report_text, 150) AS report_text,
+       LENGTH(dr.report_text) > 150 AS is_truncated
+FROM daily_reports dr
+JOIN employees e ON dr.employee_id = e.id
+JOIN employee_roles r ON e.role_id = r.id
+WHERE e.branch_id = :branch_id 
+AND (r.role_level = :general_level OR e.id = :employee_id)
+ORDER BY dr.created_at DESC
+LIMIT 3
+''')
+
+_Q_RECENT_REPORTS_OWN = text('''
+SELECT e.full_name, r.role_name, dr.report_date,
+       LEFT(dr.report_text, 150) AS report_text,
+       LENGTH(dr.report_text) > 150 AS is_truncated
+FROM daily_reports dr
+JOIN employees e ON dr.employee_id = e.id
+JOIN employee_roles r ON e.role_id = r.id
+WHERE e.id = :employee_id
+ORDER BY dr.created_at DESC
+LIMIT 3
+''')
+
+_Q_BRANCH_EMPLOYEES_PAGE = text('''
+SELECT e.id, e.username, e.full_name, e.profile_pic_url, e.is_active,
+       r.role_name, r.role_level, COUNT(*) OVER () AS total_count
+FROM employees e
+JOIN employee_roles r ON e.role_id = r.id
+WHERE e.branch_id = :branch_id
+ORDER BY r.role_level, e.full_name, e.id
+LIMIT :limit OFFSET :offset
+''')
+
+_Q_GENERAL_EMPLOYEES_PAGE = text('''
+SELECT e.id, e.username, e.full_name, e.profile_pic_url, e.is_active,
+       r.role_name, r.role_level, COUNT(*) OVER () AS total_count
+FROM employees e
+JOIN employee_roles r ON e.role_id = r.id
+WHERE e.branch_id = :branch_id AND r.role_level = :general_level
+ORDER BY e.full_name, e.id
+LIMIT :limit OFFSET :offset
+''')
+
+_Q_USERNAME_COUNT = text('''
+SELECT COUNT(*) FROM employees WHERE username = :username
+''')
+
+_Q_INSERT_GENERAL_EMPLOYEE = text('''
+INSERT INTO employees (branch_id, role_id, username, password, full_name, profile_pic_url, is_active)
+SELECT :branch_id, r.id, :username, :password, :full_name, :profile_pic_url, TRUE
+FROM employee_roles r
+WHERE r.role_level = :role_level AND r.company_id = (
+    SELECT company_id FROM branches WHERE id = :branch_id
+)
+LIMIT 1
+RETURNING id
+''')
+
+_Q_DEACTIVATE_EMPLOYEE = text('''
+UPDATE employees SET is_active = FALSE WHERE id = :id
+''')
+
+_Q_ACTIVATE_EMPLOYEE = text('''
+UPDATE employees SET is_active = TRUE WHERE id = :id
+''')
+
+_Q_ASSIGNABLE_BRANCH_EMPLOYEES = text('''
+SELECT e.id, e.full_name, r.role_name
+FROM employees e
+JOIN employee_roles r ON e.role_id = r.id
+WHERE e.branch_id = :branch_id AND e.is_active = TRUE
+  AND e.id != :current_employee  -- Don't include self
+ORDER BY r.role_level, e.full_name
+''')
+
+_Q_ASSIGNABLE_GENERAL_EMPLOYEES = text('''
+SELECT e.id, e.full_name, r.role_name
+FROM employees e
+JOIN employee_roles r ON e.role_id = r.id
+WHERE e.branch_id = :branch_id AND e.is_active = TRUE
+  AND r.role_level = :general_level
+ORDER BY e.full_name
+''')
+
+_Q_BRANCH_ROLES = text('''
+SELECT DISTINCT r.id, r.role_name, r.role_level
+FROM employee_roles r
+JOIN employees e ON e.role_id = r.id
+WHERE e.branch_id = :branch_id
+ORDER BY r.role_level
+''')
+
+_Q_BRANCH_EMPLOYEE_OPTIONS = text('''
+SELECT e.id, e.full_name, r.role_name
+FROM employees e
+JOIN employee_roles r ON e.role_id = r.id
+WHERE e.branch_id = :branch_id
+ORDER BY r.role_level, e.full_name
+''')
+
+_Q_GENERAL_EMPLOYEE_OPTIONS = text('''
+SELECT e.id, e.full_name, r.role_name
+FROM employees e
+JOIN employee_roles r ON e.role_id = r.id
+WHERE e.branch_id = :branch_id AND r.role_level = :general_level
+ORDER BY e.full_name
+''')
+
+# Report filters shared by the report day list and the reports of one day;
+# a NULL parameter disables its predicate
+_REPORT_FILTERS = '''
+FROM daily_reports dr
+JOIN employees e ON dr.employee_id = e.id
+JOIN employee_roles r ON e.role_id = r.id
+WHERE dr.report_date BETWEEN :start_date AND :end_date
+  AND (:branch_id IS NULL OR e.branch_id = :branch_id)
+  AND (:role_id IS NULL OR e.role_id = :role_id)
+  AND (:employee_id IS NULL OR dr.employee_id = :employee_id)
+  AND (:general_level IS NULL OR r.role_level = :general_level)
+'''
+
+_Q_REPORT_DAYS_PAGE = text('''
+SELECT dr.report_date, COUNT(*) AS report_count,
+       COUNT(*) OVER () AS total_days,
+       (SUM(COUNT(*)) OVER ())::bigint AS total_reports
+''' + _REPORT_FILTERS + '''
+GROUP BY dr.report_date
+ORDER BY dr.report_date DESC
+LIMIT :limit OFFSET :offset
+''')
+
+_Q_REPORTS_FOR_DAY = text('''
+SELECT e.full_name, r.role_name, dr.report_date, dr.report_text
+''' + _REPORT_FILTERS + '''
+  AND dr.report_date = :report_date
+ORDER BY r.role_level, e.full_name, dr.id
+''')
+
+_Q_INSERT_TASK = text('''
+INSERT INTO tasks (
+    branch_id, employee_id, task_description, due_date, is_completed
+) VALUES (
+    :branch_id, :employee_id, :task_description, :due_date, FALSE
+)
+''')
+
+_Q_COMPLETE_TASK = text('''
+UPDATE tasks SET is_completed = TRUE 
+WHERE id = :id
+''')
+
+_Q_COMPLETE_MY_TASKS = text('''
+UPDATE tasks SET is_completed = TRUE 
+WHERE id = ANY(:ids) AND employee_id = :employee_id
+''')
+
+_Q_REOPEN_TASK = text('''
+UPDATE tasks SET is_completed = FALSE 
+WHERE id = :id
+''')
+
+_Q_BRANCH_TASKS_PAGE = text('''
+SELECT t.id, e.full_name, r.role_name, t.task_description, 
+       t.due_date, t.is_completed, t.created_at, COUNT(*) OVER () AS total_count
+FROM tasks t
+JOIN employees e ON t.employee_id = e.id
+JOIN employee_roles r ON e.role_id = r.id
+WHERE t.branch_id = :branch_id
+  AND (:is_completed IS NULL OR t.is_completed = :is_completed)
+ORDER BY t.due_date ASC, t.created_at DESC, t.id
+LIMIT :limit OFFSET :offset
+''')
+
+_Q_ASST_MANAGER_TASKS_PAGE = text('''
+SELECT t.id, e.full_name, r.role_name, t.task_description, 
+       t.due_date, t.is_completed, t.created_at, COUNT(*) OVER () AS total_count
+FROM tasks t
+JOIN employees e ON t.employee_id = e.id
+JOIN employee_roles r ON e.role_id = r.id
+WHERE (t.employee_id = :employee_id OR
+      (e.branch_id = :branch_id AND r.role_level = :general_level))
+  AND (:is_completed IS NULL OR t.is_completed = :is_completed)
+ORDER BY t.due_date ASC, t.created_at DESC, t.id
+LIMIT :limit OFFSET :offset
+''')
+
+_Q_MY_TASKS = text('''
+SELECT t.id, t.task_description, t.due_date, t.is_completed, t.created_at
+FROM tasks t
+WHERE t.employee_id = :employee_id
+  AND (:is_completed IS NULL OR t.is_completed = :is_completed)
+ORDER BY t.due_date ASC, t.created_at DESC
+''')
+
+_Q_MY_REPORTS = text('''
+SELECT dr.id, dr.report_date, dr.report_text
+FROM daily_reports dr
+WHERE dr.employee_id = :employee_id AND dr.report_date BETWEEN :start_date AND :end_date
+ORDER BY dr.report_date DESC
+''')
 
 def employee_dashboard(engine):
     """Role-based employee dashboard.
@@ -18,15 +327,7 @@ def employee_dashboard(engine):
     
     with engine.connect() as conn:
         # Fetch employee details including role
-        result = conn.execute(text('''
-        SELECT e.id, e.full_name, e.username, e.profile_pic_url, 
-               b.id as branch_id, b.branch_name, 
-               r.id as role_id, r.role_name, r.role_level
-        FROM employees e
-        JOIN branches b ON e.branch_id = b.id
-        JOIN employee_roles r ON e.role_id = r.id
-        WHERE e.id = :employee_id
-        '''), {'employee_id': employee_id})
+        result = conn.execute(_Q_EMPLOYEE_DETAILS, {'employee_id': employee_id})
         
         employee_details = result.fetchone()
     
@@ -54,40 +355,46 @@ def employee_dashboard(engine):
     # Display welcome message with role
     st.write(f"Welcome, {employee_name} ({role_name}) - {branch_name} Branch")
     
-    # Role-specific navigation
+    # Role-specific navigation. Unlike st.tabs, only the selected section
+    # runs on each rerun, so the other sections' queries are skipped.
     if role_level == RolePermissions.MANAGER or role_level == RolePermissions.ASST_MANAGER:
         # Manager and Asst. Manager navigation
-        tabs = st.tabs(["Dashboard", "Employees", "Tasks", "Reports", "Profile"])
+        selected = st.radio(
+            "Navigation",
+            ["Dashboard", "Employees", "Tasks", "Reports", "Profile"],
+            horizontal=True,
+            label_visibility="collapsed",
+            key="employee_active_tab"
+        )
         
-        with tabs[0]:
+        if selected == "Dashboard":
             display_role_dashboard(engine, branch_id, role_level)
-        
-        with tabs[1]:
+        elif selected == "Employees":
             manage_branch_employees(engine, branch_id, role_level)
-            
-        with tabs[2]:
+        elif selected == "Tasks":
             manage_tasks(engine, branch_id, role_level)
-            
-        with tabs[3]:
+        elif selected == "Reports":
             view_reports(engine, branch_id, role_level)
-            
-        with tabs[4]:
-            edit_profile(engine, employee_id)
+        elif selected == "Profile":
+            edit_my_profile(engine)
     else:
         # General Employee navigation
-        tabs = st.tabs(["Dashboard", "Tasks", "My Reports", "Profile"])
+        selected = st.radio(
+            "Navigation",
+            ["Dashboard", "Tasks", "My Reports", "Profile"],
+            horizontal=True,
+            label_visibility="collapsed",
+            key="employee_active_tab"
+        )
         
-        with tabs[0]:
+        if selected == "Dashboard":
             display_role_dashboard(engine, branch_id, role_level)
-            
-        with tabs[1]:
+        elif selected == "Tasks":
             view_employee_tasks(engine, employee_id)
-            
-        with tabs[2]:
+        elif selected == "My Reports":
             view_my_reports(engine, employee_id)
-            
-        with tabs[3]:
-            edit_profile(engine, employee_id)
+        elif selected == "Profile":
+            edit_my_profile(engine)
     
     # Logout option
     if st.sidebar.button("Logout"):
@@ -109,97 +416,41 @@ def display_role_dashboard(engine, branch_id, role_level):
     col1, col2, col3, col4 = st.columns(4)
     
     with engine.connect() as conn:
-        # Task stats
+        # Task, report and employee stats in a single statement
+        params = {
+            'branch_id': branch_id,
+            'employee_id': employee_id,
+            'today': datetime.date.today(),
+            'general_level': RolePermissions.GENERAL_EMPLOYEE
+        }
+        
         if role_level == RolePermissions.MANAGER:
-            # Get all branch tasks
-            result = conn.execute(text('''
-            SELECT COUNT(*) FROM tasks 
-            WHERE branch_id = :branch_id AND is_completed = FALSE
-            '''), {'branch_id': branch_id})
-            pending_tasks = result.fetchone()[0]
+            # All branch tasks and employees
+            result = conn.execute(_Q_STATS_MANAGER, params)
         elif role_level == RolePermissions.ASST_MANAGER:
-            # Get tasks for general employees plus own tasks
-            result = conn.execute(text('''
-            SELECT COUNT(*) FROM tasks 
-            WHERE (employee_id IN (
-                SELECT id FROM employees WHERE branch_id = :branch_id AND role_id = (
-                    SELECT id FROM employee_roles WHERE role_level = 3
-                )
-            ) OR employee_id = :employee_id) AND is_completed = FALSE
-            '''), {'branch_id': branch_id, 'employee_id': employee_id})
-            pending_tasks = result.fetchone()[0]
+            # Tasks for general employees plus own tasks
+            result = conn.execute(_Q_STATS_ASST_MANAGER, params)
         else:
-            # Get own tasks only
-            result = conn.execute(text('''
-            SELECT COUNT(*) FROM tasks 
-            WHERE employee_id = :employee_id AND is_completed = FALSE
-            '''), {'employee_id': employee_id})
-            pending_tasks = result.fetchone()[0]
-        
-        # Personal report stats
-        today = datetime.date.today()
-        result = conn.execute(text('''
-        SELECT COUNT(*) FROM daily_reports 
-        WHERE employee_id = :employee_id AND report_date = :today
-        '''), {'employee_id': employee_id, 'today': today})
-        todays_report = result.fetchone()[0] > 0
+            # Own tasks only
+            result = conn.execute(_Q_STATS_OWN, params)
         
-        # Get employee counts for managers/asst. managers
-        if role_level <= RolePermissions.ASST_MANAGER:
-            if role_level == RolePermissions.MANAGER:
-                result = conn.execute(text('''
-                SELECT COUNT(*) FROM employees 
-                WHERE branch_id = :branch_id AND is_active = TRUE
-                '''), {'branch_id': branch_id})
-            else:
-                result = conn.execute(text('''
-                SELECT COUNT(*) FROM employees e
-                JOIN employee_roles r ON e.role_id = r.id
-                WHERE e.branch_id = :branch_id AND e.is_active = TRUE 
-                AND r.role_level = :general_level
-                '''), {'branch_id': branch_id, 'general_level': RolePermissions.GENERAL_EMPLOYEE})
-            
-            employee_count = result.fetchone()[0]
+        pending_tasks, todays_report_count, employee_count = result.fetchone()
+        todays_report = todays_report_count > 0
         
         # Get recent activities
         if role_level == RolePermissions.MANAGER:
             # For managers - see all branch activity
-            result = conn.execute(text('''
-            SELECT e.full_name, r.role_name, dr.report_date, dr.report_text 
-            FROM daily_reports dr
-            JOIN employees e ON dr.employee_id = e.id
-            JOIN employee_roles r ON e.role_id = r.id
-            WHERE e.branch_id = :branch_id
-            ORDER BY dr.created_at DESC
-            LIMIT 3
-            '''), {'branch_id': branch_id})
+            result = conn.execute(_Q_RECENT_REPORTS_BRANCH, {'branch_id': branch_id})
         elif role_level == RolePermissions.ASST_MANAGER:
             # For asst. managers - see own and general employees
-            result = conn.execute(text('''
-            SELECT e.full_name, r.role_name, dr.report_date, dr.report_text 
-            FROM daily_reports dr
-            JOIN employees e ON dr.employee_id = e.id
-            JOIN employee_roles r ON e.role_id = r.id
-            WHERE e.branch_id = :branch_id 
-            AND (r.role_level = :general_level OR e.id = :employee_id)
-            ORDER BY dr.created_at DESC
-            LIMIT 3
-            '''), {
+            result = conn.execute(_Q_RECENT_REPORTS_ASST_MANAGER, {
                 'branch_id': branch_id, 
                 'general_level': RolePermissions.GENERAL_EMPLOYEE,
                 'employee_id': employee_id
             })
         else:
             # For general employees - see only own
-            result = conn.execute(text('''
-            SELECT e.full_name, r.role_name, dr.report_date, dr.report_text 
-            FROM daily_reports dr
-            JOIN employees e ON dr.employee_id = e.id
-            JOIN employee_roles r ON e.role_id = r.id
-            WHERE e.id = :employee_id
-            ORDER BY dr.created_at DESC
-            LIMIT 3
-            '''), {'employee_id': employee_id})
+            result = conn.execute(_Q_RECENT_REPORTS_OWN, {'employee_id': employee_id})
         
         recent_reports = result.fetchall()
     
@@ -259,36 +510,9 @@ def display_role_dashboard(engine, branch_id, role_level):
                 if not report_text:
                     st.error("Please enter your report")
                 else:
-                    with engine.connect() as conn:
-                        today = datetime.date.today()
-                        
-                        # Check if report already exists
-                        result = conn.execute(text('''
-                        SELECT id FROM daily_reports 
-                        WHERE employee_id = :employee_id AND report_date = :today
-                        '''), {'employee_id': employee_id, 'today': today})
-                        
-                        existing = result.fetchone()
-                        
-                        if existing:
-                            # Update existing report
-                            conn.execute(text('''
-                            UPDATE daily_reports 
-                            SET report_text = :report_text, created_at = CURRENT_TIMESTAMP
-                            WHERE id = :id
-                            '''), {'report_text': report_text, 'id': existing[0]})
-                        else:
-                            # Create new report
-                            conn.execute(text('''
-                            INSERT INTO daily_reports (employee_id, report_date, report_text)
-                            VALUES (:employee_id, :today, :report_text)
-                            '''), {
-                                'employee_id': employee_id,
-                                'today': today,
-                                'report_text': report_text
-                            })
-                        
-                        conn.commit()
+                    # Adds today's report, or replaces it if already submitted
+                    with engine.begin() as conn:
+                        ReportModel.upsert_report(conn, employee_id, datetime.date.today(), report_text)
                     
                     st.success("Report submitted successfully")
                     del st.session_state.submit_report
@@ -298,18 +522,17 @@ def display_role_dashboard(engine, branch_id, role_level):
     st.subheader("Recent Reports")
     
     if recent_reports:
-        for report in recent_reports:
-            name = report[0]
-            role = report[1]
-            date = report[2].strftime('%d %b, %Y') if report[2] else "Unknown"
-            text = report[3]
-            
-            st.markdown(f"""
-            <div class="report-item">
-                <div><strong>{name}</strong> ({role}) - {date}</div>
-                <p>{text[:150]}{'...' if len(text) > 150 else ''}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        # Send all cards to the browser in a single element
+        st.markdown("\n".join(
+            _RECENT_REPORT_TMPL.format(
+                name=html.escape(report[0]),
+                role=html.escape(report[1]),
+                date=report[2].strftime('%d %b, %Y') if report[2] else "Unknown",
+                text=html.escape(report[3]),
+                ellipsis='...' if report[4] else ''
+            )
+            for report in recent_reports
+        ), unsafe_allow_html=True)
     else:
         st.info("No recent reports found")
 
@@ -330,37 +553,32 @@ def manage_branch_employees(engine, branch_id, role_level):
         tabs = st.tabs(["General Employees", "Add Employee"])
     
     with tabs[0]:
-        # Fetch employees based on role permissions
+        page, page_key = _page_input("branch_employees_page", ())
+        offset = (page - 1) * _PAGE_SIZE
+        
+        # Fetch one page of employees based on role permissions
         with engine.connect() as conn:
             if role_level == RolePermissions.MANAGER:
                 # Managers can see all employees in their branch
-                result = conn.execute(text('''
-                SELECT e.id, e.username, e.full_name, e.profile_pic_url, e.is_active,
-                       r.role_name, r.role_level
-                FROM employees e
-                JOIN employee_roles r ON e.role_id = r.id
-                WHERE e.branch_id = :branch_id
-                ORDER BY r.role_level, e.full_name
-                '''), {'branch_id': branch_id})
+                result = conn.execute(_Q_BRANCH_EMPLOYEES_PAGE, {'branch_id': branch_id, 'limit': _PAGE_SIZE, 'offset': offset})
             else:
                 # Asst. Managers can only see General Employees
-                result = conn.execute(text('''
-                SELECT e.id, e.username, e.full_name, e.profile_pic_url, e.is_active,
-                       r.role_name, r.role_level
-                FROM employees e
-                JOIN employee_roles r ON e.role_id = r.id
-                WHERE e.branch_id = :branch_id AND r.role_level = :general_level
-                ORDER BY e.full_name
-                '''), {
+                result = conn.execute(_Q_GENERAL_EMPLOYEES_PAGE, {
                     'branch_id': branch_id,
-                    'general_level': RolePermissions.GENERAL_EMPLOYEE
+                    'general_level': RolePermissions.GENERAL_EMPLOYEE,
+                    'limit': _PAGE_SIZE,
+                    'offset': offset
                 })
             
             employees = result.fetchall()
         
+        _record_page_count(page_key, page, employees, 7, _PAGE_SIZE)
+        
         if not employees:
-            st.info("No employees found")
+            st.info("No employees found" if page == 1 else "No employees on this page")
         else:
+            st.caption(f"Showing {offset + 1}-{offset + len(employees)} of {employees[0][7]} employees")
+            
             # Group by role if manager
             if role_level == RolePermissions.MANAGER:
                 employees_by_role = {}
@@ -391,47 +609,85 @@ def manage_branch_employees(engine, branch_id, role_level):
                 if not full_name or not username or not password:
                     st.error("Please fill all required fields")
                 else:
-                    with engine.connect() as conn:
+                    with engine.begin() as conn:
                         # Check if username already exists
-                        result = conn.execute(text('''
-                        SELECT COUNT(*) FROM employees WHERE username = :username
-                        '''), {'username': username})
+                        result = conn.execute(_Q_USERNAME_COUNT, {'username': username})
                         
                         if result.fetchone()[0] > 0:
                             st.error(f"Username '{username}' already exists")
                         else:
                             try:
-                                # Get the General Employee role ID
-                                result = conn.execute(text('''
-                                SELECT id FROM employee_roles 
-                                WHERE role_level = :role_level AND company_id = (
-                                    SELECT company_id FROM branches WHERE id = :branch_id
-                                )
-                                '''), {
-                                    'role_level': RolePermissions.GENERAL_EMPLOYEE,
-                                    'branch_id': branch_id
-                                })
-                                
-                                role_id = result.fetchone()[0]
-                                
-                                # Add the employee
-                                conn.execute(text('''
-                                INSERT INTO employees (branch_id, role_id, username, password, full_name, profile_pic_url, is_active)
-                                VALUES (:branch_id, :role_id, :username, :password, :full_name, :profile_pic_url, TRUE)
-                                '''), {
+                                # Add the employee with the company's General Employee role,
+                                # resolving the role inside the same statement
+                                result = conn.execute(_Q_INSERT_GENERAL_EMPLOYEE, {
                                     'branch_id': branch_id,
-                                    'role_id': role_id,
+                                    'role_level': RolePermissions.GENERAL_EMPLOYEE,
                                     'username': username,
-                                    'password': password,
+                                    'password': hash_password(password),
                                     'full_name': full_name,
                                     'profile_pic_url': profile_pic_url if profile_pic_url else "https://www.gravatar.com/avatar/00000000000000000000000000000000?d=mp&f=y"
                                 })
                                 
-                                conn.commit()
-                                st.success(f"Successfully added {full_name} as General Employee")
+                                if result.fetchone():
+                                    _assignable_employees.clear()
+                                    _branch_roles.clear()
+                                    _branch_employees.clear()
+                                    st.success(f"Successfully added {full_name} as General Employee")
+                                else:
+                                    st.error("General Employee role is not set up for this company")
                             except Exception as e:
                                 st.error(f"Error adding employee: {e}")
 
+def _page_input(name, filters):
+    """Page number input for a paginated list.
+    
+    The widget key includes the list's filters, so changing a filter starts
+    the list over at page 1. The page is capped at the page count that
+    _record_page_count saved on an earlier run with the same filters.
+    
+    Args:
+        name: Base session key for the input
+        filters: Tuple of the list's current filter values
+        
+    Returns:
+        tuple: (page, key), where key is passed on to _record_page_count
+    """
+    key = f"{name}_{hash(filters)}"
+    page_count = st.session_state.get(f"{key}_count")
+    
+    # Pull a page left past the end by an earlier run back to the last page
+    if page_count and st.session_state.get(key, 1) > page_count:
+        st.session_state[key] = page_count
+    
+    page = st.number_input("Page", min_value=1, max_value=page_count, step=1, key=key)
+    return page, key
+
+def _record_page_count(key, page, rows, total_col, page_size):
+    """Save a list's page count for _page_input.
+    
+    The count comes from the COUNT(*) OVER () column of the page's rows. A
+    page past the end has no rows to count, so the list goes back to page 1.
+    Reruns the script if the current page is past the end.
+    
+    Args:
+        key: Key returned by _page_input
+        page: Current page number
+        rows: Rows fetched for the page
+        total_col: Index of the COUNT(*) OVER () column in each row
+        page_size: Number of rows per page
+    """
+    if rows:
+        page_count = max(1, -(-rows[0][total_col] // page_size))
+    elif page > 1:
+        page_count = 1
+    else:
+        return
+    
+    if st.session_state.get(f"{key}_count") != page_count:
+        st.session_state[f"{key}_count"] = page_count
+        if page > page_count:
+            st.rerun()
+
 def display_employee_list(engine, employees, viewer_role_level):
     """Display a list of employees with appropriate actions based on viewer role.
     
@@ -455,7 +711,11 @@ def display_employee_list(engine, employees, viewer_role_level):
         cols = st.columns([1, 3, 1] if can_manage else [1, 4])
         
         with cols[0]:
-            st.image(profile_pic_url, width=60)
+            # Let the browser defer off-screen pictures instead of fetching them all
+            st.markdown(
+                f'<img src="{html.escape(profile_pic_url)}" width="60" loading="lazy" decoding="async">',
+                unsafe_allow_html=True
+            )
         
         with cols[1]:
             st.write(f"**{full_name}**")
@@ -466,25 +726,53 @@ def display_employee_list(engine, employees, viewer_role_level):
             with cols[2]:
                 if is_active:
                     if st.button("Deactivate", key=f"deactivate_{employee_id}"):
-                        with engine.connect() as conn:
-                            conn.execute(text('''
-                            UPDATE employees SET is_active = FALSE WHERE id = :id
-                            '''), {'id': employee_id})
-                            conn.commit()
+                        with engine.begin() as conn:
+                            conn.execute(_Q_DEACTIVATE_EMPLOYEE, {'id': employee_id})
+                        _assignable_employees.clear()
                         st.success(f"Deactivated {full_name}")
                         st.rerun()
                 else:
                     if st.button("Activate", key=f"activate_{employee_id}"):
-                        with engine.connect() as conn:
-                            conn.execute(text('''
-                            UPDATE employees SET is_active = TRUE WHERE id = :id
-                            '''), {'id': employee_id})
-                            conn.commit()
+                        with engine.begin() as conn:
+                            conn.execute(_Q_ACTIVATE_EMPLOYEE, {'id': employee_id})
+                        _assignable_employees.clear()
                         st.success(f"Activated {full_name}")
                         st.rerun()
         
         st.markdown("---")
 
+@st.cache_data(ttl=60)
+def _assignable_employees(_engine, branch_id, role_level, current_employee_id):
+    """Get the employees a manager can assign tasks to.
+    
+    Cached for a minute so reruns of the Assign Task form do not query the
+    database each time. The engine is not part of the cache key.
+    
+    Args:
+        _engine: SQLAlchemy database engine
+        branch_id: Branch ID
+        role_level: Role level of the assigning employee
+        current_employee_id: ID of the assigning employee
+        
+    Returns:
+        list: (id, full_name, role_name) tuples
+    """
+    with _engine.connect() as conn:
+        if role_level == RolePermissions.MANAGER:
+            # Managers can assign to all branch employees
+            result = conn.execute(_Q_ASSIGNABLE_BRANCH_EMPLOYEES, {
+                'branch_id': branch_id,
+                'current_employee': current_employee_id
+            })
+        else:
+            # Asst. Managers can only assign to General Employees
+            result = conn.execute(_Q_ASSIGNABLE_GENERAL_EMPLOYEES, {
+                'branch_id': branch_id,
+                'general_level': RolePermissions.GENERAL_EMPLOYEE
+            })
+        
+        return [tuple(row) for row in result]
+
 def manage_tasks(engine, branch_id, role_level):
     """Manage tasks based on role permissions.
     
@@ -503,35 +791,7 @@ def manage_tasks(engine, branch_id, role_level):
             st.subheader("Assign New Task")
             
             # Get assignable employees based on role
-            with engine.connect() as conn:
-                if role_level == RolePermissions.MANAGER:
-                    # Managers can assign to all branch employees
-                    result = conn.execute(text('''
-                    SELECT e.id, e.full_name, r.role_name
-                    FROM employees e
-                    JOIN employee_roles r ON e.role_id = r.id
-                    WHERE e.branch_id = :branch_id AND e.is_active = TRUE
-                      AND e.id != :current_employee  -- Don't include self
-                    ORDER BY r.role_level, e.full_name
-                    '''), {
-                        'branch_id': branch_id,
-                        'current_employee': st.session_state.user["id"]
-                    })
-                else:
-                    # Asst. Managers can only assign to General Employees
-                    result = conn.execute(text('''
-                    SELECT e.id, e.full_name, r.role_name
-                    FROM employees e
-                    JOIN employee_roles r ON e.role_id = r.id
-                    WHERE e.branch_id = :branch_id AND e.is_active = TRUE
-                      AND r.role_level = :general_level
-                    ORDER BY e.full_name
-                    '''), {
-                        'branch_id': branch_id,
-                        'general_level': RolePermissions.GENERAL_EMPLOYEE
-                    })
-                
-                employees = result.fetchall()
+            employees = _assignable_employees(engine, branch_id, role_level, st.session_state.user["id"])
             
             if not employees:
                 st.warning("No eligible employees found to assign tasks")
@@ -554,23 +814,15 @@ def manage_tasks(engine, branch_id, role_level):
                     else:
                         # Create task
                         try:
-                            with engine.connect() as conn:
+                            with engine.begin() as conn:
                                 employee_id = employee_options[selected_employee]
                                 
-                                conn.execute(text('''
-                                INSERT INTO tasks (
-                                    branch_id, employee_id, task_description, due_date, is_completed
-                                ) VALUES (
-                                    :branch_id, :employee_id, :task_description, :due_date, FALSE
-                                )
-                                '''), {
+                                conn.execute(_Q_INSERT_TASK, {
                                     'branch_id': branch_id,
                                     'employee_id': employee_id,
                                     'task_description': task_description,
                                     'due_date': due_date
                                 })
-                                
-                                conn.commit()
                             
                             st.success(f"Task assigned to {selected_employee.split(' (')[0]}")
                         except Exception as e:
@@ -590,107 +842,116 @@ def manage_tasks(engine, branch_id, role_level):
                 key="task_status_filter"
             )
         
-        # Fetch tasks based on role permissions
+        with col2:
+            page, page_key = _page_input("branch_tasks_page", (status_filter,))
+        
+        offset = (page - 1) * _PAGE_SIZE
+        
+        # Fetch one page of tasks based on role permissions
         with engine.connect() as conn:
+            params = {
+                'is_completed': _TASK_STATUS[status_filter],
+                'limit': _PAGE_SIZE,
+                'offset': offset
+            }
+            
             if role_level == RolePermissions.MANAGER:
                 # Managers see all branch tasks
-                query = '''
-                SELECT t.id, e.full_name, r.role_name, t.task_description, 
-                       t.due_date, t.is_completed, t.created_at
-                FROM tasks t
-                JOIN employees e ON t.employee_id = e.id
-                JOIN employee_roles r ON e.role_id = r.id
-                WHERE t.branch_id = :branch_id
-                '''
-                
-                params = {'branch_id': branch_id}
-                
-            elif role_level == RolePermissions.ASST_MANAGER:
+                result = conn.execute(_Q_BRANCH_TASKS_PAGE, {**params, 'branch_id': branch_id})
+            else:
                 # Asst. Managers see their tasks and General Employee tasks
-                query = '''
-                SELECT t.id, e.full_name, r.role_name, t.task_description, 
-                       t.due_date, t.is_completed, t.created_at
-                FROM tasks t
-                JOIN employees e ON t.employee_id = e.id
-                JOIN employee_roles r ON e.role_id = r.id
-                WHERE (t.employee_id = :employee_id OR
-                      (e.branch_id = :branch_id AND r.role_level = :general_level))
-                '''
-                
-                params = {
+                result = conn.execute(_Q_ASST_MANAGER_TASKS_PAGE, {
+                    **params,
                     'employee_id': employee_id,
                     'branch_id': branch_id,
                     'general_level': RolePermissions.GENERAL_EMPLOYEE
-                }
-            
-            # Add status filter
-            if status_filter == "Pending":
-                query += ' AND t.is_completed = FALSE'
-            elif status_filter == "Completed":
-                query += ' AND t.is_completed = TRUE'
-            
-            # Sort by due date
-            query += ' ORDER BY t.due_date ASC, t.created_at DESC'
+                })
             
-            # Execute query
-            result = conn.execute(text(query), params)
             tasks = result.fetchall()
         
+        _record_page_count(page_key, page, tasks, 7, _PAGE_SIZE)
+        
         if not tasks:
-            st.info("No tasks found")
+            st.info("No tasks found" if page == 1 else "No tasks on this page")
         else:
-            # Display tasks
-            for task in tasks:
+            st.caption(f"Showing {offset + 1}-{offset + len(tasks)} of {tasks[0][7]} tasks")
+            
+            # Display tasks, numbered so the action buttons below can refer to them
+            # Send all cards to the browser in a single element
+            st.markdown("\n".join(
+                _TASK_TMPL.format(
+                    status_class="completed" if task[5] else "",
+                    number=number,
+                    assigned_to=html.escape(task[1]),
+                    role=html.escape(task[2]),
+                    due_date=task[4].strftime('%d %b, %Y') if task[4] else "No due date",
+                    description=html.escape(task[3]),
+                    status_color='#9e9e9e' if task[5] else '#4CAF50',
+                    status="Completed" if task[5] else "Pending"
+                )
+                for number, task in enumerate(tasks, start=offset + 1)
+            ), unsafe_allow_html=True)
+            
+            # Actions based on status
+            action_cols = st.columns(3)
+            for number, task in enumerate(tasks, start=offset + 1):
                 task_id = task[0]
-                assigned_to = task[1]
-                role_name = task[2]
-                description = task[3]
-                due_date = task[4].strftime('%d %b, %Y') if task[4] else "No due date"
                 is_completed = task[5]
                 
-                # Task card styling
-                status_class = "completed" if is_completed else ""
-                
-                st.markdown(f'''
-                <div class="task-item {status_class}">
-                    <div style="display: flex; justify-content: space-between;">
-                        <span><strong>Assigned to:</strong> {assigned_to} ({role_name})</span>
-                        <span><strong>Due:</strong> {due_date}</span>
-                    </div>
-                    <p>{description}</p>
-                    <div style="text-align: right; font-weight: 600; color: {'#9e9e9e' if is_completed else '#4CAF50'};">
-                        {"Completed" if is_completed else "Pending"}
-                    </div>
-                </div>
-                ''', unsafe_allow_html=True)
-                
-                # Actions based on status
-                col1, col2 = st.columns(2)
-                
-                with col1:
+                with action_cols[(number - 1) % 3]:
                     if not is_completed:
-                        if st.button(f"Mark as Completed", key=f"complete_task_{task_id}"):
-                            with engine.connect() as conn:
-                                conn.execute(text('''
-                                UPDATE tasks SET is_completed = TRUE 
-                                WHERE id = :id
-                                '''), {'id': task_id})
-                                conn.commit()
+                        if st.button(f"Complete #{number}", key=f"complete_task_{task_id}"):
+                            with engine.begin() as conn:
+                                conn.execute(_Q_COMPLETE_TASK, {'id': task_id})
                             st.success("Task marked as completed")
                             st.rerun()
-                
-                with col2:
-                    if is_completed:
-                        if st.button(f"Reopen Task", key=f"reopen_task_{task_id}"):
-                            with engine.connect() as conn:
-                                conn.execute(text('''
-                                UPDATE tasks SET is_completed = FALSE 
-                                WHERE id = :id
-                                '''), {'id': task_id})
-                                conn.commit()
+                    else:
+                        if st.button(f"Reopen #{number}", key=f"reopen_task_{task_id}"):
+                            with engine.begin() as conn:
+                                conn.execute(_Q_REOPEN_TASK, {'id': task_id})
                             st.success("Task reopened")
                             st.rerun()
 
+@st.cache_data(ttl=300, max_entries=64)
+def _branch_roles(_conn, branch_id):
+    """Get the roles held by employees of a branch.
+    
+    Feeds the "By Role" report filter. Cached for five minutes so changing
+    other report filters does not query the database each time. The
+    connection is not part of the cache key.
+    
+    Args:
+        _conn: Open SQLAlchemy connection
+        branch_id: Branch ID
+        
+    Returns:
+        list: (id, role_name) tuples ordered by role level
+    """
+    result = _conn.execute(_Q_BRANCH_ROLES, {'branch_id': branch_id})
+    return [(row[0], row[1]) for row in result]
+
+@st.cache_data(ttl=300, max_entries=64)
+def _branch_employees(_conn, branch_id, only_general):
+    """Get the employees of a branch for the report employee filter.
+    
+    Args:
+        _conn: Open SQLAlchemy connection
+        branch_id: Branch ID
+        only_general: Only return General Employees
+        
+    Returns:
+        list: (id, full_name, role_name) tuples
+    """
+    if only_general:
+        result = _conn.execute(_Q_GENERAL_EMPLOYEE_OPTIONS, {
+            'branch_id': branch_id,
+            'general_level': RolePermissions.GENERAL_EMPLOYEE
+        })
+    else:
+        result = _conn.execute(_Q_BRANCH_EMPLOYEE_OPTIONS, {'branch_id': branch_id})
+    
+    return [tuple(row) for row in result]
+
 def view_reports(engine, branch_id, role_level):
     """View reports based on role permissions.
     
@@ -733,78 +994,32 @@ def view_reports(engine, branch_id, role_level):
     # Date range calculation
     today = datetime.date.today()
     
-    if date_filter == "Today":
-        start_date = end_date = today
-    elif date_filter == "This Week":
-        start_date = today - timedelta(days=today.weekday())
-        end_date = today
-    elif date_filter == "This Month":
-        start_date = today.replace(day=1)
-        end_date = today
-    elif date_filter == "Last Month":
-        last_month = today.month - 1 if today.month > 1 else 12
-        last_month_year = today.year if today.month > 1 else today.year - 1
-        start_date = datetime.date(last_month_year, last_month, 1)
-        # Calculate last day of last month
-        if last_month == 12:
-            end_date = datetime.date(last_month_year, last_month, 31)
-        else:
-            end_date = datetime.date(last_month_year, last_month + 1, 1) - timedelta(days=1)
-    elif date_filter == "Last 3 Months":
-        start_date = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
-        start_date = (start_date - timedelta(days=1)).replace(day=1)
-        end_date = today
-    elif date_filter == "Custom Range":
+    if date_filter == "Custom Range":
         cols = st.columns(2)
         with cols[0]:
             start_date = st.date_input("Start Date", today - timedelta(days=30))
         with cols[1]:
             end_date = st.date_input("End Date", today)
+    else:
+        start_date, end_date = get_date_range_from_filter(date_filter)
     
-    # Additional role-specific filters
-    selected_role = None
-    selected_employee = None
-    
-    if role_level == RolePermissions.MANAGER and employee_filter == "By Role":
-        with engine.connect() as conn:
-            result = conn.execute(text('''
-            SELECT DISTINCT r.role_name
-            FROM employee_roles r
-            JOIN employees e ON e.role_id = r.id
-            WHERE e.branch_id = :branch_id
-            ORDER BY r.role_level
-            '''), {'branch_id': branch_id})
-            
-            roles = [row[0] for row in result.fetchall()]
+    # Look up the filter options and the reports over one connection
+    with engine.connect() as conn:
+        # Additional role-specific filters
+        selected_role = None
+        selected_employee = None
         
-        selected_role = st.selectbox("Select Role", roles)
-    
-    elif ((role_level == RolePermissions.MANAGER and employee_filter == "Individual Employee") or
-          (role_level == RolePermissions.ASST_MANAGER and employee_filter == "General Employees")):
-        with engine.connect() as conn:
-            if role_level == RolePermissions.MANAGER:
-                # Managers can select any employee
-                result = conn.execute(text('''
-                SELECT e.id, e.full_name, r.role_name
-                FROM employees e
-                JOIN employee_roles r ON e.role_id = r.id
-                WHERE e.branch_id = :branch_id
-                ORDER BY r.role_level, e.full_name
-                '''), {'branch_id': branch_id})
-            else:
-                # Asst. Managers can only select General Employees
-                result = conn.execute(text('''
-                SELECT e.id, e.full_name, r.role_name
-                FROM employees e
-                JOIN employee_roles r ON e.role_id = r.id
-                WHERE e.branch_id = :branch_id AND r.role_level = :general_level
-                ORDER BY e.full_name
-                '''), {
-                    'branch_id': branch_id,
-                    'general_level': RolePermissions.GENERAL_EMPLOYEE
-                })
-            
-            employees = result.fetchall()
+        if role_level == RolePermissions.MANAGER and employee_filter == "By Role":
+            role_options = {role_name: role_id for role_id, role_name in _branch_roles(conn, branch_id)}
+            selected_role_name = st.selectbox("Select Role", list(role_options.keys()))
+            selected_role = role_options.get(selected_role_name)
+        
+        elif ((role_level == RolePermissions.MANAGER and employee_filter == "Individual Employee") or
+              (role_level == RolePermissions.ASST_MANAGER and employee_filter == "General Employees")):
+            # Managers can select any employee, Asst. Managers only General Employees
+            employees = _branch_employees(
+                conn, branch_id, role_level != RolePermissions.MANAGER
+            )
             
             if not employees:
                 st.warning("No employees found")
@@ -813,108 +1028,59 @@ def view_reports(engine, branch_id, role_level):
                 employee_options = {f"{emp[1]} ({emp[2]})": emp[0] for emp in employees}
                 selected_employee_name = st.selectbox("Select Employee", list(employee_options.keys()))
                 selected_employee = employee_options[selected_employee_name]
-    
-    # Fetch reports based on filters
-    with engine.connect() as conn:
+        
+        # Filters for the report query; None means no filter on that column
+        filters = None
+        
         if role_level == RolePermissions.MANAGER:
             if employee_filter == "All Employees":
-                # All branch employees
-                result = conn.execute(text('''
-                SELECT e.full_name, r.role_name, dr.report_date, dr.report_text
-                FROM daily_reports dr
-                JOIN employees e ON dr.employee_id = e.id
-                JOIN employee_roles r ON e.role_id = r.id
-                WHERE e.branch_id = :branch_id AND dr.report_date BETWEEN :start_date AND :end_date
-                ORDER BY dr.report_date DESC, r.role_level, e.full_name
-                '''), {
-                    'branch_id': branch_id,
-                    'start_date': start_date,
-                    'end_date': end_date
-                })
+                filters = {'branch_id': branch_id}
             elif employee_filter == "By Role" and selected_role:
-                # By role
-                result = conn.execute(text('''
-                SELECT e.full_name, r.role_name, dr.report_date, dr.report_text
-                FROM daily_reports dr
-                JOIN employees e ON dr.employee_id = e.id
-                JOIN employee_roles r ON e.role_id = r.id
-                WHERE e.branch_id = :branch_id AND r.role_name = :role_name 
-                  AND dr.report_date BETWEEN :start_date AND :end_date
-                ORDER BY dr.report_date DESC, e.full_name
-                '''), {
-                    'branch_id': branch_id,
-                    'role_name': selected_role,
-                    'start_date': start_date,
-                    'end_date': end_date
-                })
+                filters = {'branch_id': branch_id, 'role_id': selected_role}
             elif employee_filter == "Individual Employee" and selected_employee:
-                # Individual employee
-                result = conn.execute(text('''
-                SELECT e.full_name, r.role_name, dr.report_date, dr.report_text
-                FROM daily_reports dr
-                JOIN employees e ON dr.employee_id = e.id
-                JOIN employee_roles r ON e.role_id = r.id
-                WHERE dr.employee_id = :employee_id AND dr.report_date BETWEEN :start_date AND :end_date
-                ORDER BY dr.report_date DESC
-                '''), {
-                    'employee_id': selected_employee,
-                    'start_date': start_date,
-                    'end_date': end_date
-                })
-            else:
-                result = None
+                filters = {'employee_id': selected_employee}
         elif role_level == RolePermissions.ASST_MANAGER:
             if employee_filter == "General Employees" and selected_employee:
-                # Individual General Employee
-                result = conn.execute(text('''
-                SELECT e.full_name, r.role_name, dr.report_date, dr.report_text
-                FROM daily_reports dr
-                JOIN employees e ON dr.employee_id = e.id
-                JOIN employee_roles r ON e.role_id = r.id
-                WHERE dr.employee_id = :employee_id AND dr.report_date BETWEEN :start_date AND :end_date
-                ORDER BY dr.report_date DESC
-                '''), {
-                    'employee_id': selected_employee,
-                    'start_date': start_date,
-                    'end_date': end_date
-                })
+                filters = {'employee_id': selected_employee}
             elif employee_filter == "My Reports":
-                # Own reports
-                result = conn.execute(text('''
-                SELECT e.full_name, r.role_name, dr.report_date, dr.report_text
-                FROM daily_reports dr
-                JOIN employees e ON dr.employee_id = e.id
-                JOIN employee_roles r ON e.role_id = r.id
-                WHERE dr.employee_id = :employee_id AND dr.report_date BETWEEN :start_date AND :end_date
-                ORDER BY dr.report_date DESC
-                '''), {
-                    'employee_id': employee_id,
-                    'start_date': start_date,
-                    'end_date': end_date
-                })
+                filters = {'employee_id': employee_id}
             else:
                 # All General Employees (default)
-                result = conn.execute(text('''
-                SELECT e.full_name, r.role_name, dr.report_date, dr.report_text
-                FROM daily_reports dr
-                JOIN employees e ON dr.employee_id = e.id
-                JOIN employee_roles r ON e.role_id = r.id
-                WHERE e.branch_id = :branch_id AND r.role_level = :general_level
-                  AND dr.report_date BETWEEN :start_date AND :end_date
-                ORDER BY dr.report_date DESC, e.full_name
-                '''), {
-                    'branch_id': branch_id,
-                    'general_level': RolePermissions.GENERAL_EMPLOYEE,
-                    'start_date': start_date,
-                    'end_date': end_date
-                })
+                filters = {'branch_id': branch_id, 'general_level': RolePermissions.GENERAL_EMPLOYEE}
         
-        reports = result.fetchall() if result else []
+        page, page_key = _page_input(
+            "branch_reports_page",
+            (employee_filter, start_date, end_date, selected_role, selected_employee)
+        )
+        offset = (page - 1) * _REPORT_DAYS_PAGE_SIZE
+        
+        if filters is None:
+            st.info("No reports found for the selected criteria")
+            return
+        
+        params = {
+            'start_date': start_date,
+            'end_date': end_date,
+            'branch_id': filters.get('branch_id'),
+            'role_id': filters.get('role_id'),
+            'employee_id': filters.get('employee_id'),
+            'general_level': filters.get('general_level')
+        }
+        
+        # One page of report days with their report counts
+        report_days = conn.execute(_Q_REPORT_DAYS_PAGE, {
+            **params,
+            'limit': _REPORT_DAYS_PAGE_SIZE,
+            'offset': offset
+        }).fetchall()
     
-    if not reports:
-        st.info("No reports found for the selected criteria")
+    _record_page_count(page_key, page, report_days, 2, _REPORT_DAYS_PAGE_SIZE)
+    
+    if not report_days:
+        st.info("No reports found for the selected criteria" if page == 1 else "No reports on this page")
     else:
-        st.success(f"Found {len(reports)} reports")
+        st.success(f"Found {report_days[0][3]} reports")
+        st.caption(f"Showing days {offset + 1}-{offset + len(report_days)} of {report_days[0][2]}")
         
         # Create PDF download button
         if st.button("Download as PDF"):
@@ -922,33 +1088,50 @@ def view_reports(engine, branch_id, role_level):
             # For now, just show a placeholder message
             st.info("PDF download feature will be implemented")
         
-        # Group reports by date
-        reports_by_date = {}
-        for report in reports:
-            date_str = report[2].strftime('%Y-%m-%d')
-            if date_str not in reports_by_date:
-                reports_by_date[date_str] = []
-            reports_by_date[date_str].append(report)
+        # Display reports by date; report bodies are only fetched for opened days
+        for report_date, count, _, _ in report_days:
+            _report_day(engine, params, report_date, count)
+
+@st.fragment
+def _report_day(engine, params, report_date, count):
+    """Display one day of the branch report list.
+    
+    The day's reports are only fetched while its toggle is on. Runs as a
+    fragment, so switching it only reruns this day instead of the whole
+    dashboard. The toggle's key includes the report filters, so open days
+    close again when the filters change.
+    
+    Args:
+        engine: SQLAlchemy database engine
+        params: Report filter parameters for _Q_REPORTS_FOR_DAY
+        report_date: Date of the reports
+        count: Number of reports on that date
+    """
+    is_open = st.toggle(
+        f"{report_date.strftime('%A, %d %b %Y')} ({count} reports)",
+        key=f"open_reports_{report_date}_{hash(tuple(params.items()))}"
+    )
+    
+    if is_open:
+        with engine.connect() as conn:
+            reports = conn.execute(_Q_REPORTS_FOR_DAY, {**params, 'report_date': report_date}).fetchall()
         
-        # Display reports by date
-        for date_str, date_reports in sorted(reports_by_date.items(), reverse=True):
-            date_obj = datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
-            with st.expander(f"{date_obj.strftime('%A, %d %b %Y')} ({len(date_reports)} reports)", expanded=False):
-                for report in date_reports:
-                    name = report[0]
-                    role = report[1]
-                    text = report[3]
-                    
-                    st.markdown(f"""
-                    <div class="report-item">
-                        <div><strong>{name}</strong> ({role})</div>
-                        <p>{text}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+        st.markdown("\n".join(
+            _REPORT_TMPL.format(
+                name=html.escape(report[0]),
+                role=html.escape(report[1]),
+                text=html.escape(report[3])
+            )
+            for report in reports
+        ), unsafe_allow_html=True)
 
+@st.fragment
 def view_employee_tasks(engine, employee_id):
     """View and act on tasks assigned to the employee.
     
+    Runs as a fragment, so filtering or completing tasks only reruns the
+    task list instead of the whole dashboard.
+    
     Args:
         engine: SQLAlchemy database engine
         employee_id: Employee ID
@@ -964,63 +1147,48 @@ def view_employee_tasks(engine, employee_id):
     
     # Fetch tasks
     with engine.connect() as conn:
-        query = '''
-        SELECT t.id, t.task_description, t.due_date, t.is_completed, t.created_at
-        FROM tasks t
-        WHERE t.employee_id = :employee_id
-        '''
-        
-        params = {'employee_id': employee_id}
-        
-        # Add status filter
-        if status_filter == "Pending":
-            query += ' AND t.is_completed = FALSE'
-        elif status_filter == "Completed":
-            query += ' AND t.is_completed = TRUE'
-        
-        # Sort by due date
-        query += ' ORDER BY t.due_date ASC, t.created_at DESC'
-        
-        # Execute query
-        result = conn.execute(text(query), params)
+        result = conn.execute(_Q_MY_TASKS, {
+            'employee_id': employee_id,
+            'is_completed': _TASK_STATUS[status_filter]
+        })
         tasks = result.fetchall()
     
     if not tasks:
         st.info("No tasks found")
     else:
-        # Display tasks
-        for task in tasks:
-            task_id = task[0]
-            description = task[1]
-            due_date = task[2].strftime('%d %b, %Y') if task[2] else "No due date"
-            is_completed = task[3]
-            
-            # Task card styling
-            status_class = "completed" if is_completed else ""
-            
-            st.markdown(f'''
-            <div class="task-item {status_class}">
-                <div style="display: flex; justify-content: space-between;">
-                    <span><strong>Due:</strong> {due_date}</span>
-                    <span style="font-weight: 600; color: {'#9e9e9e' if is_completed else '#4CAF50'};">
-                        {"Completed" if is_completed else "Pending"}
-                    </span>
-                </div>
-                <p>{description}</p>
-            </div>
-            ''', unsafe_allow_html=True)
+        # Display tasks, numbered so the action buttons below can refer to them
+        st.markdown("\n".join(
+            _MY_TASK_TMPL.format(
+                status_class="completed" if task[3] else "",
+                number=number,
+                due_date=task[2].strftime('%d %b, %Y') if task[2] else "No due date",
+                status_color='#9e9e9e' if task[3] else '#4CAF50',
+                status="Completed" if task[3] else "Pending",
+                description=html.escape(task[1])
+            )
+            for number, task in enumerate(tasks, start=1)
+        ), unsafe_allow_html=True)
+        
+        # Complete any number of pending tasks with one submit
+        pending = [(number, task) for number, task in enumerate(tasks, start=1) if not task[3]]
+        
+        if pending:
+            with st.form("complete_my_tasks_form"):
+                for number, task in pending:
+                    st.checkbox(f"#{number}: {task[1]}", key=f"complete_my_task_{task[0]}")
+                
+                submitted = st.form_submit_button("Mark Selected as Completed")
             
-            # Actions based on status
-            if not is_completed:
-                if st.button(f"Mark as Completed", key=f"complete_my_task_{task_id}"):
-                    with engine.connect() as conn:
-                        conn.execute(text('''
-                        UPDATE tasks SET is_completed = TRUE 
-                        WHERE id = :id
-                        '''), {'id': task_id})
-                        conn.commit()
-                    st.success("Task marked as completed")
-                    st.rerun()
+            if submitted:
+                ids = [task[0] for _, task in pending if st.session_state[f"complete_my_task_{task[0]}"]]
+                
+                if not ids:
+                    st.warning("Select at least one task")
+                else:
+                    with engine.begin() as conn:
+                        conn.execute(_Q_COMPLETE_MY_TASKS, {'ids': ids, 'employee_id': employee_id})
+                    st.success(f"Marked {len(ids)} task(s) as completed")
+                    st.rerun(scope="fragment")
 
 def view_my_reports(engine, employee_id):
     """View personal reports with filtering.
@@ -1044,36 +1212,18 @@ def view_my_reports(engine, employee_id):
     # Date range calculation
     today = datetime.date.today()
     
-    if date_filter == "This Month":
-        start_date = today.replace(day=1)
-        end_date = today
-    elif date_filter == "Last Month":
-        last_month = today.month - 1 if today.month > 1 else 12
-        last_month_year = today.year if today.month > 1 else today.year - 1
-        start_date = datetime.date(last_month_year, last_month, 1)
-        # Calculate last day of last month
-        if last_month == 12:
-            end_date = datetime.date(last_month_year, last_month, 31)
-        else:
-            end_date = datetime.date(last_month_year, last_month + 1, 1) - timedelta(days=1)
-    elif date_filter == "Custom Range":
+    if date_filter == "Custom Range":
         cols = st.columns(2)
         with cols[0]:
             start_date = st.date_input("Start Date", today - timedelta(days=30))
         with cols[1]:
             end_date = st.date_input("End Date", today)
-    else:  # All Reports
-        start_date = datetime.date(2000, 1, 1)  # A date far in the past
-        end_date = today
+    else:
+        start_date, end_date = get_date_range_from_filter(date_filter)
     
     # Fetch reports
     with engine.connect() as conn:
-        result = conn.execute(text('''
-        SELECT dr.id, dr.report_date, dr.report_text
-        FROM daily_reports dr
-        WHERE dr.employee_id = :employee_id AND dr.report_date BETWEEN :start_date AND :end_date
-        ORDER BY dr.report_date DESC
-        '''), {
+        result = conn.execute(_Q_MY_REPORTS, {
             'employee_id': employee_id,
             'start_date': start_date,
             'end_date': end_date
@@ -1093,134 +1243,10 @@ def view_my_reports(engine, employee_id):
             st.info("PDF download feature will be implemented")
         
         # Display reports
-        for report in reports:
-            report_id = report[0]
-            report_date = report[1]
-            report_text = report[2]
-            
-            st.markdown(f'''
-            <div class="report-item">
-                <div><strong>{report_date.strftime('%A, %d %b %Y')}</strong></div>
-                <p>{report_text}</p>
-            </div>
-            ''', unsafe_allow_html=True)
-
-def edit_profile(engine, employee_id):
-    """Allow employee to edit their profile.
-    
-    Args:
-        engine: SQLAlchemy database engine
-        employee_id: Employee ID
-    """
-    st.subheader("My Profile")
-    
-    # Fetch current employee data
-    with engine.connect() as conn:
-        result = conn.execute(text('''
-        SELECT e.username, e.full_name, e.profile_pic_url,
-               b.branch_name, r.role_name
-        FROM employees e
-        JOIN branches b ON e.branch_id = b.id
-        JOIN employee_roles r ON e.role_id = r.id
-        WHERE e.id = :employee_id
-        '''), {'employee_id': employee_id})
-        
-        employee_data = result.fetchone()
-    
-    if not employee_data:
-        st.error("Could not retrieve your profile information. Please try again later.")
-        return
-    
-    username, current_full_name, current_pic_url, branch_name, role_name = employee_data
-    
-    # Display current info
-    col1, col2 = st.columns([1, 2])
-    
-    with col1:
-        st.write("Current Picture:")
-        try:
-            st.image(current_pic_url, width=150)
-        except:
-            st.image("https://www.gravatar.com/avatar/00000000000000000000000000000000?d=mp&f=y", width=150)
-    
-    with col2:
-        st.write(f"**Username:** {username} (cannot be changed)")
-        st.write(f"**Branch:** {branch_name}")
-        st.write(f"**Role:** {role_name}")
-    
-    # Form for updating profile
-    with st.form("update_profile_form"):
-        new_full_name = st.text_input("Full Name", value=current_full_name)
-        new_profile_pic_url = st.text_input("Profile Picture URL", value=current_pic_url or "")
-        
-        # Password change
-        st.subheader("Change Password")
-        current_password = st.text_input("Current Password", type="password")
-        new_password = st.text_input("New Password", type="password")
-        confirm_password = st.text_input("Confirm New Password", type="password")
-        
-        submitted = st.form_submit_button("Update Profile")
-        
-        if submitted:
-            updates_made = False
-            
-            # Update profile info if changed
-            if new_full_name != current_full_name or new_profile_pic_url != current_pic_url:
-                with engine.connect() as conn:
-                    conn.execute(text('''
-                    UPDATE employees
-                    SET full_name = :full_name, profile_pic_url = :profile_pic_url
-                    WHERE id = :employee_id
-                    '''), {
-                        'full_name': new_full_name,
-                        'profile_pic_url': new_profile_pic_url,
-                        'employee_id': employee_id
-                    })
-                    conn.commit()
-                
-                # Update session state
-                st.session_state.user["full_name"] = new_full_name
-                
-                updates_made = True
-                st.success("Profile information updated successfully")
-            
-            # Update password if requested
-            if current_password or new_password or confirm_password:
-                if not current_password:
-                    st.error("Please enter your current password to change it")
-                elif not new_password:
-                    st.error("Please enter a new password")
-                elif new_password != confirm_password:
-                    st.error("New passwords do not match")
-                else:
-                    # Verify current password
-                    with engine.connect() as conn:
-                        result = conn.execute(text('''
-                        SELECT COUNT(*) FROM employees
-                        WHERE id = :employee_id AND password = :current_password
-                        '''), {
-                            'employee_id': employee_id,
-                            'current_password': current_password
-                        })
-                        
-                        if result.fetchone()[0] == 0:
-                            st.error("Current password is incorrect")
-                        else:
-                            # Update password
-                            conn.execute(text('''
-                            UPDATE employees
-                            SET password = :new_password
-                            WHERE id = :employee_id
-                            '''), {
-                                'new_password': new_password,
-                                'employee_id': employee_id
-                            })
-                            conn.commit()
-                            
-                            updates_made = True
-                            st.success("Password updated successfully")
-            
-            if updates_made:
-                st.info("Refreshing in 3 seconds...")
-                time.sleep(3)
-                st.rerun()
+        st.markdown("\n".join(
+            _MY_REPORT_TMPL.format(
+                date=report[1].strftime('%A, %d %b %Y'),
+                text=html.escape(report[2])
+            )
+            for report in reports
+        ), unsafe_allow_html=True)
@@ -20,7 +20,11 @@ def edit_my_profile(engine):
         st.error("Could not retrieve your profile information. Please try again later.")
         return
     
-    username, current_full_name, current_pic_url = employee_data
+    username = employee_data[1]
+    current_full_name = employee_data[2]
+    current_pic_url = employee_data[3]
+    branch_name = employee_data[6]
+    role_name = employee_data[8]
     
     # Display current profile picture
     col1, col2 = st.columns([1, 2])
@@ -33,6 +37,8 @@ def edit_my_profile(engine):
     
     with col2:
         st.markdown(f"<p><strong>Username:</strong> {username}</p>", unsafe_allow_html=True)
+        st.markdown(f"<p><strong>Branch:</strong> {branch_name}</p>", unsafe_allow_html=True)
+        st.markdown(f"<p><strong>Role:</strong> {role_name}</p>", unsafe_allow_html=True)
         st.info("Username cannot be changed as it is used for login purposes.")
     
     # Form for updating profile
@@ -55,37 +61,31 @@ def edit_my_profile(engine):
         if submitted:
             updates_made = False
             
-            # Check if any changes were made to name or picture URL
-            if new_full_name != current_full_name or new_profile_pic_url != current_pic_url:
-                with engine.connect() as conn:
+            # Profile and password changes share one connection
+            with engine.connect() as conn:
+                # Check if any changes were made to name or picture URL
+                if new_full_name != current_full_name or new_profile_pic_url != current_pic_url:
                     EmployeeModel.update_profile(conn, employee_id, new_full_name, new_profile_pic_url)
-                
-                # Update session state with new values
-                st.session_state.user["full_name"] = new_full_name
-                st.session_state.user["profile_pic_url"] = new_profile_pic_url
-                
-                updates_made = True
-                st.success("Profile information updated successfully.")
-            
-            # Handle password change if attempted
-            if current_password or new_password or confirm_password:
-                if not current_password:
-                    st.error("Please enter your current password to change it.")
-                elif not new_password:
-                    st.error("Please enter a new password.")
-                elif new_password != confirm_password:
-                    st.error("New passwords do not match.")
-                else:
-                    # Verify current password
-                    with engine.connect() as conn:
-                        is_valid = EmployeeModel.verify_password(conn, employee_id, current_password)
                     
-                    if not is_valid:
+                    # Update session state with new values
+                    st.session_state.user["full_name"] = new_full_name
+                    st.session_state.user["profile_pic_url"] = new_profile_pic_url
+                    
+                    updates_made = True
+                    st.success("Profile information updated successfully.")
+                
+                # Handle password change if attempted
+                if current_password or new_password or confirm_password:
+                    if not current_password:
+                        st.error("Please enter your current password to change it.")
+                    elif not new_password:
+                        st.error("Please enter a new password.")
+                    elif new_password != confirm_password:
+                        st.error("New passwords do not match.")
+                    elif not EmployeeModel.verify_password(conn, employee_id, current_password):
                         st.error("Current password is incorrect.")
                     else:
-                        # Update password - Fixed method name from update_password to reset_password
-                        with engine.connect() as conn:
-                            EmployeeModel.reset_password(conn, employee_id, new_password)
+                        EmployeeModel.reset_password(conn, employee_id, new_password)
                         
                         updates_made = True
                         st.success("Password updated successfully.")
@@ -1,8 +1,34 @@
 import streamlit as st
 import datetime
+import html
 from database.models.report_model import ReportModel
 from utils.helpers import get_date_range_from_filter
 
+# HTML for a report card; values must be escaped before formatting
+_REPORT_TMPL = """<div class="report-item">
+<strong>{date}</strong>
+<p>{text}</p>
+</div>"""
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_reports(_engine, employee_id, start_date, end_date):
+    """Get an employee's reports grouped by month, cached for a minute.
+    
+    Cleared whenever the employee submits or edits a report. The engine is
+    not part of the cache key.
+    
+    Args:
+        _engine: SQLAlchemy database engine
+        employee_id: ID of the employee
+        start_date: Start date for filtering
+        end_date: End date for filtering
+        
+    Returns:
+        list: (period, report_count, reports) tuples
+    """
+    with _engine.connect() as conn:
+        return [tuple(row) for row in ReportModel.get_employee_reports_grouped(conn, employee_id, start_date, end_date)]
+
 def submit_report(engine):
     """Form for employee to submit daily reports."""
     st.markdown('<h2 class="sub-header">Submit Daily Report</h2>', unsafe_allow_html=True)
@@ -11,13 +37,7 @@ def submit_report(engine):
     
     with st.form("submit_report_form"):
         report_date = st.date_input("Report Date", datetime.date.today())
-        
-        # Check if a report already exists for this date
-        with engine.connect() as conn:
-            existing_report = ReportModel.check_report_exists(conn, employee_id, report_date)
-        
-        if existing_report:
-            st.warning(f"You already have a report for {report_date.strftime('%d %b, %Y')}. Submitting will update your existing report.")
+        st.caption("If you already have a report for this date, submitting will update it.")
         
         report_text = st.text_area("What did you work on today?", height=200)
         
@@ -27,16 +47,12 @@ def submit_report(engine):
                 st.error("Please enter your report")
             else:
                 try:
-                    with engine.connect() as conn:
-                        if existing_report:
-                            # Update existing report
-                            ReportModel.update_report(conn, existing_report[0], report_date, report_text)
-                            success_message = "Report updated successfully"
-                        else:
-                            # Insert new report
-                            ReportModel.add_report(conn, employee_id, report_date, report_text)
-                            success_message = "Report submitted successfully"
+                    with engine.begin() as conn:
+                        inserted = ReportModel.upsert_report(conn, employee_id, report_date, report_text)
+                    
+                    success_message = "Report submitted successfully" if inserted else "Report updated successfully"
                     
+                    _cached_reports.clear()
                     st.success(success_message)
                 except Exception as e:
                     st.error(f"Error submitting report: {e}")
@@ -45,6 +61,13 @@ def view_my_reports(engine):
     """View and manage personal reports."""
     st.markdown('<h2 class="sub-header">My Reports</h2>', unsafe_allow_html=True)
     
+    # While a report is being edited, show only the edit form and skip
+    # fetching and rendering the report list
+    edit_report = st.session_state.get('edit_report')
+    if edit_report:
+        _edit_report(engine, edit_report)
+        return
+    
     employee_id = st.session_state.user["id"]
     
     # Date range filter
@@ -70,81 +93,84 @@ def view_my_reports(engine):
             # Set default dates based on filter
             start_date, end_date = get_date_range_from_filter(date_filter)
     
-    # Fetch reports
-    with engine.connect() as conn:
-        reports = ReportModel.get_employee_reports(conn, employee_id, start_date, end_date)
+    # Fetch reports, grouped by month/year for better organization
+    periods = _cached_reports(engine, employee_id, start_date, end_date)
     
     # Display reports
-    if not reports:
+    if not periods:
         st.info("No reports found for the selected period")
     else:
-        st.write(f"Found {len(reports)} reports")
+        st.write(f"Found {sum(row[1] for row in periods)} reports")
         
-        # Group by month/year for better organization
-        reports_by_period = {}
-        for report in reports:
-            period = report[1].strftime('%B %Y')
-            if period not in reports_by_period:
-                reports_by_period[period] = []
-            reports_by_period[period].append(report)
-        
-        for period, period_reports in reports_by_period.items():
-            with st.expander(f"{period} ({len(period_reports)} reports)", expanded=True):
-                for report in period_reports:
-                    report_id = report[0]
-                    report_date = report[1]
-                    report_text = report[2]
-                    
-                    col1, col2 = st.columns([3, 1])
-                    with col1:
-                        st.markdown(f'''
-                        <div class="report-item">
-                            <strong>{report_date.strftime('%A, %d %b %Y')}</strong>
-                            <p>{report_text}</p>
-                        </div>
-                        ''', unsafe_allow_html=True)
-                    
-                    with col2:
-                        if st.button("Edit", key=f"edit_{report_id}"):
-                            st.session_state.edit_report = {
-                                'id': report_id,
-                                'date': report_date,
-                                'text': report_text
-                            }
-                            st.rerun()
+        for period, report_count, period_reports in periods:
+            with st.expander(f"{period} ({report_count} reports)", expanded=True):
+                st.markdown("\n".join(
+                    _REPORT_TMPL.format(date=report['display_date'], text=html.escape(report['text']))
+                    for report in period_reports
+                ), unsafe_allow_html=True)
+                
+                # One picker per month instead of an Edit button per report
+                reports_by_id = {report['id']: report for report in period_reports}
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    report_id = st.selectbox(
+                        "Report to edit",
+                        list(reports_by_id),
+                        format_func=lambda rid: reports_by_id[rid]['display_date'],
+                        key=f"edit_pick_{period}",
+                        label_visibility="collapsed"
+                    )
+                with col2:
+                    if st.button("Edit", key=f"edit_{period}"):
+                        report = reports_by_id[report_id]
+                        st.session_state.edit_report = {
+                            'id': report_id,
+                            'date': datetime.date.fromisoformat(report['date']),
+                            'text': report['text']
+                        }
+                        st.rerun()
+
+def _edit_report(engine, edit_report):
+    """Form for editing one of the employee's reports.
+    
+    Args:
+        engine: SQLAlchemy database engine
+        edit_report: dict with the id, date and text of the report
+    """
+    st.markdown('<h3 class="sub-header">Edit Report</h3>', unsafe_allow_html=True)
+    
+    with st.form("edit_report_form"):
+        report_date = st.date_input("Report Date", edit_report['date'])
+        report_text = st.text_area("Report Text", edit_report['text'], height=200)
         
-    # Edit report if selected
-    if hasattr(st.session_state, 'edit_report'):
-        st.markdown('<h3 class="sub-header">Edit Report</h3>', unsafe_allow_html=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            submitted = st.form_submit_button("Update Report")
+        with col2:
+            cancel = st.form_submit_button("Cancel")
         
-        with st.form("edit_report_form"):
-            report_date = st.date_input("Report Date", st.session_state.edit_report['date'])
-            report_text = st.text_area("Report Text", st.session_state.edit_report['text'], height=200)
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                submitted = st.form_submit_button("Update Report")
-            with col2:
-                cancel = st.form_submit_button("Cancel")
-            
-            if submitted:
-                if not report_text:
-                    st.error("Please enter your report")
-                else:
-                    try:
-                        with engine.connect() as conn:
-                            ReportModel.update_report(
-                                conn, 
-                                st.session_state.edit_report['id'], 
-                                report_date, 
-                                report_text
-                            )
+        if submitted:
+            if not report_text:
+                st.error("Please enter your report")
+            else:
+                try:
+                    with engine.connect() as conn:
+                        updated = ReportModel.update_report(
+                            conn, 
+                            edit_report['id'], 
+                            report_date, 
+                            report_text
+                        )
+                    if updated:
+                        _cached_reports.clear()
                         st.success("Report updated successfully")
-                        del st.session_state.edit_report
+                        st.session_state.pop('edit_report', None)
                         st.rerun()
-                    except Exception as e:
-                        st.error(f"Error updating report: {e}")
-            
-            if cancel:
-                del st.session_state.edit_report
-                st.rerun()
+                    else:
+                        st.error("You already have a report for that date")
+                except Exception as e:
+                    st.error(f"Error updating report: {e}")
+        
+        if cancel:
+            st.session_state.pop('edit_report', None)
+            st.rerun()
@@ -1,7 +1,35 @@
 import streamlit as st
+import html
 from database.models.task_model import TaskModel
 from utils.helpers import format_timestamp
 
+# HTML for a task card; values must be escaped before formatting
+_TASK_TMPL = """<div class="task-item {status_class}">
+<strong>{label}Due: {due_date}</strong>
+<p>{description}</p>
+<div style="text-align: right; color: #777; font-size: 0.8rem;">
+Created: {created_at}
+</div>
+</div>"""
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_tasks(_engine, employee_id, status_filter):
+    """Get an employee's direct and branch tasks, cached for a minute.
+    
+    Cleared whenever the employee completes a task. The engine is not part
+    of the cache key.
+    
+    Args:
+        _engine: SQLAlchemy database engine
+        employee_id: ID of the employee
+        status_filter: 'All Tasks', 'Pending' or 'Completed'
+        
+    Returns:
+        list: Task dicts keyed by the columns of TaskModel.get_tasks_for_employee
+    """
+    with _engine.connect() as conn:
+        return [row._asdict() for row in TaskModel.get_tasks_for_employee(conn, employee_id, status_filter)]
+
 def view_my_tasks(engine):
     """View and manage personal tasks."""
     st.markdown('<h2 class="sub-header">My Tasks</h2>', unsafe_allow_html=True)
@@ -12,16 +40,8 @@ def view_my_tasks(engine):
     status_options = ["All Tasks", "Pending", "Completed"]
     status_filter = st.selectbox("Show", status_options, key="employee_task_status_filter")
     
-    # Determine task completion filter based on selection
-    completed_filter = None
-    if status_filter == "Pending":
-        completed_filter = False
-    elif status_filter == "Completed":
-        completed_filter = True
-    
     # Fetch tasks
-    with engine.connect() as conn:
-        tasks = TaskModel.get_employee_tasks(conn, employee_id, completed_filter)
+    tasks = _cached_tasks(engine, employee_id, status_filter)
     
     # Display tasks
     if not tasks:
@@ -29,53 +49,57 @@ def view_my_tasks(engine):
     else:
         st.write(f"Found {len(tasks)} tasks")
         
-        # Separate into pending and completed for better organization
-        pending_tasks = [task for task in tasks if not task[3]]
-        completed_tasks = [task for task in tasks if task[3]]
+        # Separate into pending and completed for better organization,
+        # using the employee's own assignment status for branch tasks
+        pending_tasks = [task for task in tasks if not task['assignment_completed']]
+        completed_tasks = [task for task in tasks if task['assignment_completed']]
         
         # Display pending tasks first
         if pending_tasks and status_filter != "Completed":
             st.markdown('<h3 class="sub-header">Pending Tasks</h3>', unsafe_allow_html=True)
             
-            for task in pending_tasks:
-                task_id = task[0]
-                task_description = task[1]
-                due_date = format_timestamp(task[2])
-                created_at = format_timestamp(task[4])
-                task_date_str = task[2].strftime('%Y%m%d') if task[2] else 'nodate'
+            # Display pending tasks, numbered so the checkboxes below can refer to them
+            st.markdown("\n".join(
+                _TASK_TMPL.format(
+                    status_class="",
+                    label=f"#{number} ",
+                    due_date=format_timestamp(task['due_date']),
+                    description=html.escape(task['task_description']),
+                    created_at=format_timestamp(task['created_at'])
+                )
+                for number, task in enumerate(pending_tasks, start=1)
+            ), unsafe_allow_html=True)
+            
+            # Tick any number of tasks and complete them with one submit
+            with st.form("complete_tasks"):
+                for number, task in enumerate(pending_tasks, start=1):
+                    st.checkbox(f"#{number}: {task['task_description']}", key=f"chk_{task['id']}")
                 
-                st.markdown(f'''
-                <div class="task-item">
-                    <strong>Due: {due_date}</strong>
-                    <p>{task_description}</p>
-                    <div style="text-align: right; color: #777; font-size: 0.8rem;">
-                        Created: {created_at}
-                    </div>
-                </div>
-                ''', unsafe_allow_html=True)
+                submitted = st.form_submit_button("Mark Selected as Completed")
+            
+            if submitted:
+                ids = [task['id'] for task in pending_tasks if st.session_state[f"chk_{task['id']}"]]
                 
-                if st.button(f"Mark as Completed", key=f"employee_complete_{task_id}_{task_date_str}"):
+                if not ids:
+                    st.warning("Select at least one task")
+                else:
                     with engine.connect() as conn:
-                        TaskModel.update_task_status(conn, task_id, True)
-                    st.success("Task marked as completed")
+                        TaskModel.bulk_complete(conn, employee_id, ids)
+                    _cached_tasks.clear()
+                    st.success(f"Marked {len(ids)} task(s) as completed")
                     st.rerun()
         
         # Display completed tasks
         if completed_tasks and status_filter != "Pending":
             st.markdown('<h3 class="sub-header">Completed Tasks</h3>', unsafe_allow_html=True)
             
-            for task in completed_tasks:
-                task_id = task[0]
-                task_description = task[1]
-                due_date = format_timestamp(task[2])
-                created_at = format_timestamp(task[4])
-                
-                st.markdown(f'''
-                <div class="task-item completed">
-                    <strong>Due: {due_date}</strong>
-                    <p>{task_description}</p>
-                    <div style="text-align: right; color: #777; font-size: 0.8rem;">
-                        Created: {created_at}
-                    </div>
-                </div>
-                ''', unsafe_allow_html=True)
+            st.markdown("\n".join(
+                _TASK_TMPL.format(
+                    status_class="completed",
+                    label="",
+                    due_date=format_timestamp(task['due_date']),
+                    description=html.escape(task['task_description']),
+                    created_at=format_timestamp(task['created_at'])
+                )
+                for task in completed_tasks
+            ), unsafe_allow_html=True)
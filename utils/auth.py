@@ -1,9 +1,91 @@
+import functools
+import hmac
+import bcrypt
 import streamlit as st
 from sqlalchemy import text
 
+# Prefixes of bcrypt hashes; any other stored value is a legacy plaintext password
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# Active company and employee accounts with a username, companies first
+_Q_LOGIN_ACCOUNTS = text('''
+SELECT 'company' AS kind, id, username, company_name AS full_name, profile_pic_url,
+       NULL::int AS branch_id, NULL AS branch_name, NULL::int AS company_id, NULL AS company_name,
+       NULL::int AS role_id, NULL AS role_name, NULL::int AS role_level, password
+FROM companies
+WHERE username = :username AND is_active = TRUE
+UNION ALL
+SELECT 'employee' AS kind, e.id, e.username, e.full_name, e.profile_pic_url,
+       b.id, b.branch_name, c.id, c.company_name,
+       r.id, r.role_name, r.role_level, e.password
+FROM employees e
+JOIN branches b ON e.branch_id = b.id
+JOIN companies c ON b.company_id = c.id
+JOIN employee_roles r ON e.role_id = r.id
+WHERE e.username = :username
+  AND e.is_active = TRUE AND b.is_active = TRUE AND c.is_active = TRUE
+ORDER BY kind
+''')
+
+def hash_password(password):
+    """Hash a password for storage.
+    
+    bcrypt releases the GIL while hashing, so other Streamlit sessions keep
+    running while one session hashes a password.
+    
+    Args:
+        password: Plaintext password
+        
+    Returns:
+        str: bcrypt hash of the password
+    """
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=10)).decode()
+
+def check_password(password, stored_password):
+    """Check a password against the value stored in the database.
+    
+    Args:
+        password: Plaintext password to check
+        stored_password: bcrypt hash, or a legacy plaintext password
+        
+    Returns:
+        bool: True if the password matches, False otherwise
+    """
+    if not stored_password:
+        return False
+    
+    if stored_password.startswith(_BCRYPT_PREFIXES):
+        return bcrypt.checkpw(password.encode(), stored_password.encode())
+    
+    # Legacy plaintext password, compared in constant time
+    return hmac.compare_digest(password.encode(), stored_password.encode())
+
+@functools.lru_cache(maxsize=1)
+def _admin_credentials():
+    """Read the admin username and password from Streamlit secrets once.
+    
+    The result is kept for the life of the process, so changes to the admin
+    secrets take effect after the app is restarted.
+    
+    Returns:
+        tuple: (username, password) as bytes, or None if either is not set
+    """
+    if "admin_username" not in st.secrets or "admin_password" not in st.secrets:
+        return None
+    return str(st.secrets["admin_username"]).encode(), str(st.secrets["admin_password"]).encode()
+
 def authenticate(engine, username, password):
     """Authenticate a user based on username and password.
     
+    Login runs on every sign-in, so engine should be the pooled engine from
+    database.connection.get_engine (see ENGINE_POOL_OPTIONS) rather than a
+    freshly created one, which would open a new database connection each time.
+    
+    The lookup finds accounts through the UNIQUE username indexes on
+    companies and employees, and the branch, company and role joins go
+    through primary keys. init_db also indexes the employees.branch_id, employees.role_id
+    and branches.company_id foreign keys.
+    
     Args:
         engine: SQLAlchemy database engine
         username: User's username
@@ -13,15 +95,16 @@ def authenticate(engine, username, password):
         dict: User information if authentication succeeds, None otherwise
     """
     # Check if admin credentials are properly set in Streamlit secrets
-    if "admin_username" not in st.secrets or "admin_password" not in st.secrets:
+    admin_credentials = _admin_credentials()
+    if admin_credentials is None:
         st.warning("Admin credentials are not properly configured in Streamlit secrets. Please set admin_username and admin_password in .streamlit/secrets.toml")
         return None
     
-    # Check if credentials match admin in Streamlit secrets
-    admin_username = st.secrets["admin_username"]
-    admin_password = st.secrets["admin_password"]
+    # Check if credentials match admin, comparing both in constant time
+    admin_username, admin_password = admin_credentials
+    is_admin = hmac.compare_digest(username.encode(), admin_username) & hmac.compare_digest(password.encode(), admin_password)
     
-    if username == admin_username and password == admin_password:
+    if is_admin:
         return {
             "id": 0,  # Special ID for admin
             "username": username, 
@@ -30,53 +113,36 @@ def authenticate(engine, username, password):
             "profile_pic_url": "https://www.gravatar.com/avatar/00000000000000000000000000000000?d=mp&f=y"
         }
     
-    # If not admin, check company credentials
-    with engine.connect() as conn:
-        result = conn.execute(text('''
-        SELECT id, company_name, username, profile_pic_url
-        FROM companies
-        WHERE username = :username AND password = :password AND is_active = TRUE
-        '''), {'username': username, 'password': password})
-        company = result.fetchone()
-    
-    if company:
-        return {
-            "id": company[0], 
-            "username": company[2], 
-            "full_name": company[1], 
-            "user_type": "company",
-            "profile_pic_url": company[3]
-        }
-    
-    # If not company, check employee credentials with role information
+    # If not admin, check company then employee credentials in one query
     with engine.connect() as conn:
-        result = conn.execute(text('''
-        SELECT e.id, e.username, e.full_name, e.profile_pic_url, 
-               b.id as branch_id, b.branch_name, c.id as company_id, c.company_name,
-               r.id as role_id, r.role_name, r.role_level
-        FROM employees e
-        JOIN branches b ON e.branch_id = b.id
-        JOIN companies c ON b.company_id = c.id
-        JOIN employee_roles r ON e.role_id = r.id
-        WHERE e.username = :username AND e.password = :password 
-          AND e.is_active = TRUE AND b.is_active = TRUE AND c.is_active = TRUE
-        '''), {'username': username, 'password': password})
-        employee = result.fetchone()
+        accounts = conn.execute(_Q_LOGIN_ACCOUNTS, {'username': username}).fetchall()
     
-    if employee:
+    for account in accounts:
+        if not check_password(password, account.password):
+            continue
+        
+        if account.kind == "company":
+            return {
+                "id": account.id, 
+                "username": account.username, 
+                "full_name": account.full_name, 
+                "user_type": "company",
+                "profile_pic_url": account.profile_pic_url
+            }
+        
         return {
-            "id": employee[0], 
-            "username": employee[1], 
-            "full_name": employee[2],
+            "id": account.id, 
+            "username": account.username, 
+            "full_name": account.full_name,
             "user_type": "employee",
-            "profile_pic_url": employee[3],
-            "branch_id": employee[4],
-            "branch_name": employee[5],
-            "company_id": employee[6],
-            "company_name": employee[7],
-            "role_id": employee[8],
-            "role_name": employee[9],
-            "role_level": employee[10]
+            "profile_pic_url": account.profile_pic_url,
+            "branch_id": account.branch_id,
+            "branch_name": account.branch_name,
+            "company_id": account.company_id,
+            "company_name": account.company_name,
+            "role_id": account.role_id,
+            "role_name": account.role_name,
+            "role_level": account.role_level
         }
     
     return None
@@ -1,4 +1,22 @@
 import datetime
+import functools
+from dateutil.relativedelta import relativedelta
+
+# (start, end) of each named date filter, given today's date
+_DATE_FILTERS = {
+    "Today": lambda today: (today, today),
+    "This Week": lambda today: (today - datetime.timedelta(days=today.weekday()), today),
+    "This Month": lambda today: (today.replace(day=1), today),
+    "Last Month": lambda today: (
+        today.replace(day=1) - relativedelta(months=1),
+        today.replace(day=1) - datetime.timedelta(days=1)
+    ),
+    "Last 3 Months": lambda today: (today.replace(day=1) - relativedelta(months=2), today),
+    "This Year": lambda today: (today.replace(month=1, day=1), today),
+}
+
+# Start date for "All Time"/"All Reports" and any unknown filter
+_EARLIEST_DATE = datetime.date(2000, 1, 1)
 
 def get_date_range_from_filter(date_filter):
     """Get start and end dates based on a date filter selection.
@@ -7,31 +25,18 @@ def get_date_range_from_filter(date_filter):
         date_filter: String representing the selected date range
         
     Returns:
-        tuple: (start_date, end_date)
+        tuple: (start_date, end_date), both inclusive
     """
     today = datetime.date.today()
-    
-    if date_filter == "Today":
-        start_date = today
-        end_date = today
-    elif date_filter == "This Week":
-        start_date = today - datetime.timedelta(days=today.weekday())
-        end_date = today
-    elif date_filter == "This Month":
-        start_date = today.replace(day=1)
-        end_date = today
-    elif date_filter == "This Year":
-        start_date = today.replace(month=1, day=1)
-        end_date = today
-    else:  # All Time/Reports
-        start_date = datetime.date(2000, 1, 1)
-        end_date = today
-    
-    return start_date, end_date
+    dates = _DATE_FILTERS.get(date_filter)
+    return dates(today) if dates else (_EARLIEST_DATE, today)
 
+@functools.lru_cache(maxsize=2048)
 def format_timestamp(timestamp, format_str='%d %b, %Y'):
     """Format a timestamp into a readable string.
     
+    Memoized, since task lists format the same due dates many times.
+    
     Args:
         timestamp: Datetime object
         format_str: Format string (default: '%d %b, %Y')
@@ -1,15 +1,154 @@
+import datetime
+import functools
 import io
+from itertools import groupby
+from operator import itemgetter
+from xml.sax.saxutils import escape
 from reportlab.lib.pagesizes import letter, landscape
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.units import inch
 
+@functools.lru_cache(maxsize=4096)
+def _fmt(date, format_str):
+    """Format a date, memoized since reports repeat the same dates."""
+    return date.strftime(format_str)
+
+def _period(first, last):
+    """Format a report period, e.g. '01 Mar 2026 to 31 Mar 2026'."""
+    return f"{_fmt(first, '%d %b %Y')} to {_fmt(last, '%d %b %Y')}"
+
+def _date_span(dates):
+    """Earliest and latest of an iterable of dates, found in one pass."""
+    dates = iter(dates)
+    first = last = next(dates)
+    for date in dates:
+        if date < first:
+            first = date
+        elif date > last:
+            last = date
+    return first, last
+
+def _markup(text):
+    """Turn user-entered text into Paragraph markup.
+    
+    Escapes <, > and & so they print as typed instead of being parsed as
+    (or breaking) ReportLab's inline markup, and keeps line breaks. Plain
+    single-line text, the common case, is returned as is.
+    """
+    if '<' in text or '>' in text or '&' in text:
+        text = escape(text)
+    if '\n' in text:
+        text = text.replace('\n', '<br/>')
+    return text
+
+# Paragraph styles shared by every generated PDF, built once at import
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'Title',
+    parent=_STYLES['Heading1'],
+    fontSize=16,
+    alignment=1,
+    spaceAfter=12
+)
+
+_DATERANGE_STYLE = ParagraphStyle(
+    'DateRange',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    alignment=1,
+    textColor=colors.gray
+)
+
+# Month or employee heading
+_SECTION_STYLE = ParagraphStyle(
+    'Section',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    spaceAfter=10
+)
+
+_BRANCH_STYLE = ParagraphStyle(
+    'Branch',
+    parent=_STYLES['Heading2'],
+    fontSize=16,
+    spaceAfter=10,
+    textColor=colors.blue
+)
+
+# Employee heading nested under a branch
+_BRANCH_EMPLOYEE_STYLE = ParagraphStyle(
+    'BranchEmployee',
+    parent=_STYLES['Heading3'],
+    fontSize=14,
+    spaceAfter=8
+)
+
+_DATE_STYLE = ParagraphStyle(
+    'Date',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    textColor=colors.blue
+)
+
+# Report date nested under a branch
+_BRANCH_DATE_STYLE = ParagraphStyle(
+    'BranchDate',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    textColor=colors.darkblue
+)
+
+_TEXT_STYLE = ParagraphStyle(
+    'ReportText',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    leftIndent=10
+)
+
+# Width of the date column in report tables
+_DATE_COL_WIDTH = 1.6 * inch
+
+# Layout of report tables, shared by every table and never modified
+_ROW_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+])
+
+def _report_table(rows, width, date_style=_DATE_STYLE):
+    """Lay out reports as one two-column table of date and text.
+    
+    One table per section lets ReportLab paginate the section in a single
+    pass instead of wrapping and splitting a Paragraph and Spacer per report.
+    
+    Args:
+        rows: Iterable of (date, text) pairs
+        width: Available frame width
+        date_style: Paragraph style for the date column
+        
+    Returns:
+        Table: Flowable for the rows, split across pages between or within rows
+    """
+    data = [
+        [Paragraph(_fmt(date, '%A, %d %b %Y'), date_style), Paragraph(_markup(text), _TEXT_STYLE)]
+        for date, text in rows
+    ]
+    return Table(
+        data,
+        colWidths=[_DATE_COL_WIDTH, width - _DATE_COL_WIDTH],
+        style=_ROW_TABLE_STYLE,
+        splitInRow=1
+    )
+
 def create_employee_report_pdf(reports, employee_name=None):
     """Generate a PDF report for employee daily reports.
     
     Args:
-        reports: List of report data tuples (id, date, text)
+        reports: List of report data tuples (id, date, text), newest first as
+            returned by ReportModel.get_employee_reports
         employee_name: Name of the employee (optional)
         
     Returns:
@@ -17,76 +156,30 @@ def create_employee_report_pdf(reports, employee_name=None):
     """
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter)
-    styles = getSampleStyleSheet()
     elements = []
     
     # Title
-    title_style = ParagraphStyle(
-        'Title',
-        parent=styles['Heading1'],
-        fontSize=16,
-        alignment=1,
-        spaceAfter=12
-    )
-    title = f"Work Reports: {employee_name}" if employee_name else "Work Reports"
-    elements.append(Paragraph(title, title_style))
+    title = f"Work Reports: {_markup(employee_name)}" if employee_name else "Work Reports"
+    elements.append(Paragraph(title, _TITLE_STYLE))
     elements.append(Spacer(1, 12))
     
     # Date range
     if reports:
-        date_style = ParagraphStyle(
-            'DateRange',
-            parent=styles['Normal'],
-            fontSize=10,
-            alignment=1,
-            textColor=colors.gray
-        )
-        min_date = min(report[1] for report in reports).strftime('%d %b %Y')
-        max_date = max(report[1] for report in reports).strftime('%d %b %Y')
-        elements.append(Paragraph(f"Period: {min_date} to {max_date}", date_style))
+        # Reports are newest first, so the ends of the list bound the period
+        period = _period(reports[-1][1], reports[0][1])
+        elements.append(Paragraph(f"Period: {period}", _DATERANGE_STYLE))
         elements.append(Spacer(1, 20))
     
-    # Group reports by month
-    reports_by_month = {}
-    for report in reports:
-        month_year = report[1].strftime('%B %Y')
-        if month_year not in reports_by_month:
-            reports_by_month[month_year] = []
-        reports_by_month[month_year].append(report)
-    
-    # Add each month's reports
-    for month, month_reports in reports_by_month.items():
-        # Month header
-        month_style = ParagraphStyle(
-            'Month',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceAfter=10
-        )
-        elements.append(Paragraph(month, month_style))
-        
-        # Reports for the month
-        for report in month_reports:
-            # Date
-            date_style = ParagraphStyle(
-                'Date',
-                parent=styles['Normal'],
-                fontSize=11,
-                textColor=colors.blue
-            )
-            elements.append(Paragraph(report[1].strftime('%A, %d %b %Y'), date_style))
-            
-            # Report text
-            text_style = ParagraphStyle(
-                'ReportText',
-                parent=styles['Normal'],
-                fontSize=10,
-                leftIndent=10
-            )
-            elements.append(Paragraph(report[2], text_style))
-            elements.append(Spacer(1, 12))
-        
-        elements.append(Spacer(1, 10))
+    # Add each month's reports; rows arrive newest first, so each month's
+    # reports are contiguous. Group on the integer (year, month) and format
+    # the month name once per month rather than once per report.
+    for (year, month), month_reports in groupby(reports, key=lambda report: (report[1].year, report[1].month)):
+        # Month header and the month's reports
+        elements.extend((
+            Paragraph(_fmt(datetime.date(year, month, 1), '%B %Y'), _SECTION_STYLE),
+            _report_table(((report[1], report[2]) for report in month_reports), doc.width),
+            Spacer(1, 10)
+        ))
     
     # Build PDF
     doc.build(elements)
@@ -97,7 +190,9 @@ def create_branch_report_pdf(reports, branch_name):
     """Generate a PDF report for all employees in a branch.
     
     Args:
-        reports: List of report data tuples (id, employee_name, role, date, text, created_at)
+        reports: List of report data tuples (id, employee_name, role, date, text, created_at, employee_id),
+            grouped by employee and newest first within each, as returned by
+            ReportModel.get_branch_reports
         branch_name: Name of the branch
         
     Returns:
@@ -105,79 +200,27 @@ def create_branch_report_pdf(reports, branch_name):
     """
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter)
-    styles = getSampleStyleSheet()
     elements = []
     
     # Title
-    title_style = ParagraphStyle(
-        'Title',
-        parent=styles['Heading1'],
-        fontSize=16,
-        alignment=1,
-        spaceAfter=12
-    )
-    elements.append(Paragraph(f"Branch Reports: {branch_name}", title_style))
+    elements.append(Paragraph(f"Branch Reports: {_markup(branch_name)}", _TITLE_STYLE))
     elements.append(Spacer(1, 12))
     
     # Date range
     if reports:
-        date_style = ParagraphStyle(
-            'DateRange',
-            parent=styles['Normal'],
-            fontSize=10,
-            alignment=1,
-            textColor=colors.gray
-        )
-        min_date = min(report[3] for report in reports).strftime('%d %b %Y')
-        max_date = max(report[3] for report in reports).strftime('%d %b %Y')
-        elements.append(Paragraph(f"Period: {min_date} to {max_date}", date_style))
+        period = _period(*_date_span(report[3] for report in reports))
+        elements.append(Paragraph(f"Period: {period}", _DATERANGE_STYLE))
         elements.append(Spacer(1, 20))
     
-    # Group reports by employee and date
-    reports_by_employee = {}
-    for report in reports:
-        employee_name = report[1]
-        role_name = report[2]
-        
-        key = f"{employee_name} ({role_name})"
-        if key not in reports_by_employee:
-            reports_by_employee[key] = []
-        
-        reports_by_employee[key].append(report)
-    
-    # Add each employee's reports
-    for employee, emp_reports in reports_by_employee.items():
-        # Employee header
-        emp_style = ParagraphStyle(
-            'Employee',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceAfter=10
-        )
-        elements.append(Paragraph(employee, emp_style))
-        
-        # Group by date
-        for report in emp_reports:
-            # Date
-            date_style = ParagraphStyle(
-                'Date',
-                parent=styles['Normal'],
-                fontSize=11,
-                textColor=colors.blue
-            )
-            elements.append(Paragraph(report[3].strftime('%A, %d %b %Y'), date_style))
-            
-            # Report text
-            text_style = ParagraphStyle(
-                'ReportText',
-                parent=styles['Normal'],
-                fontSize=10,
-                leftIndent=10
-            )
-            elements.append(Paragraph(report[4], text_style))
-            elements.append(Spacer(1, 12))
-        
-        elements.append(Spacer(1, 15))
+    # Add each employee's reports; rows arrive grouped by employee, and are
+    # grouped here on the employee ID since two employees can share a name
+    for (_, employee_name, role_name), emp_reports in groupby(reports, key=itemgetter(6, 1, 2)):
+        # Employee header and the employee's reports
+        elements.extend((
+            Paragraph(_markup(f"{employee_name} ({role_name})"), _SECTION_STYLE),
+            _report_table(((report[3], report[4]) for report in emp_reports), doc.width),
+            Spacer(1, 15)
+        ))
     
     # Build PDF
     doc.build(elements)
@@ -188,7 +231,9 @@ def create_company_report_pdf(reports, company_name):
     """Generate a PDF report for all branches in a company.
     
     Args:
-        reports: List of report data tuples (id, employee_name, role, branch_name, date, text, created_at)
+        reports: List of report data tuples (id, employee_name, role, branch_name, date, text, created_at, employee_id),
+            grouped by branch and employee and newest first within each, as
+            returned by ReportModel.get_company_reports
         company_name: Name of the company
         
     Returns:
@@ -196,103 +241,30 @@ def create_company_report_pdf(reports, company_name):
     """
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter, leftMargin=0.5*inch, rightMargin=0.5*inch)
-    styles = getSampleStyleSheet()
     elements = []
     
     # Title
-    title_style = ParagraphStyle(
-        'Title',
-        parent=styles['Heading1'],
-        fontSize=16,
-        alignment=1,
-        spaceAfter=12
-    )
-    elements.append(Paragraph(f"Company Reports: {company_name}", title_style))
+    elements.append(Paragraph(f"Company Reports: {_markup(company_name)}", _TITLE_STYLE))
     elements.append(Spacer(1, 12))
     
     # Date range
     if reports:
-        date_style = ParagraphStyle(
-            'DateRange',
-            parent=styles['Normal'],
-            fontSize=10,
-            alignment=1,
-            textColor=colors.gray
-        )
-        min_date = min(report[4] for report in reports).strftime('%d %b %Y')
-        max_date = max(report[4] for report in reports).strftime('%d %b %Y')
-        elements.append(Paragraph(f"Period: {min_date} to {max_date}", date_style))
+        period = _period(*_date_span(report[4] for report in reports))
+        elements.append(Paragraph(f"Period: {period}", _DATERANGE_STYLE))
         elements.append(Spacer(1, 20))
     
-    # Group reports by branch, then by employee
-    reports_by_branch = {}
-    for report in reports:
-        branch_name = report[3]
-        
-        if branch_name not in reports_by_branch:
-            reports_by_branch[branch_name] = {}
-        
-        employee_name = report[1]
-        role_name = report[2]
-        key = f"{employee_name} ({role_name})"
-        
-        if key not in reports_by_branch[branch_name]:
-            reports_by_branch[branch_name][key] = []
-        
-        reports_by_branch[branch_name][key].append(report)
-    
-    # Add each branch's reports
-    for branch_name, employees in reports_by_branch.items():
+    # Add each branch's reports; rows arrive grouped by branch and then employee
+    for branch_name, branch_reports in groupby(reports, key=itemgetter(3)):
         # Branch header
-        branch_style = ParagraphStyle(
-            'Branch',
-            parent=styles['Heading2'],
-            fontSize=16,
-            spaceAfter=10,
-            textColor=colors.blue
-        )
-        elements.append(Paragraph(f"Branch: {branch_name}", branch_style))
+        elements.append(Paragraph(f"Branch: {_markup(branch_name)}", _BRANCH_STYLE))
         
-        # For each employee in the branch
-        for employee_name, emp_reports in employees.items():
-            # Employee header
-            emp_style = ParagraphStyle(
-                'Employee',
-                parent=styles['Heading3'],
-                fontSize=14,
-                spaceAfter=8
-            )
-            elements.append(Paragraph(employee_name, emp_style))
-            
-            # Group by date
-            emp_reports_by_date = {}
-            for report in emp_reports:
-                date_str = report[4].strftime('%Y-%m-%d')
-                if date_str not in emp_reports_by_date:
-                    emp_reports_by_date[date_str] = report
-            
-            # Add each report
-            for date_str, report in sorted(emp_reports_by_date.items(), reverse=True):
-                # Date
-                date_style = ParagraphStyle(
-                    'Date',
-                    parent=styles['Normal'],
-                    fontSize=11,
-                    textColor=colors.darkblue
-                )
-                elements.append(Paragraph(report[4].strftime('%A, %d %b %Y'), date_style))
-                
-                # Report text
-                text_style = ParagraphStyle(
-                    'ReportText',
-                    parent=styles['Normal'],
-                    fontSize=10,
-                    leftIndent=10
-                )
-                elements.append(Paragraph(report[5], text_style))
-                elements.append(Spacer(1, 10))
-            
-            elements.append(Spacer(1, 10))
+        # Each employee's header and reports
+        for (_, employee_name, role_name), emp_reports in groupby(branch_reports, key=itemgetter(7, 1, 2)):
+            elements.extend((
+                Paragraph(_markup(f"{employee_name} ({role_name})"), _BRANCH_EMPLOYEE_STYLE),
+                _report_table(((report[4], report[5]) for report in emp_reports), doc.width, _BRANCH_DATE_STYLE),
+                Spacer(1, 10)
+            ))
         
         elements.append(Spacer(1, 20))
     
@@ -305,7 +277,9 @@ def create_role_report_pdf(reports, role_name, company_name):
     """Generate a PDF report for all employees of a specific role.
     
     Args:
-        reports: List of report data tuples with employee and branch info
+        reports: List of report data tuples with employee and branch info,
+            grouped by branch and employee and newest first within each, as
+            returned by ReportModel.get_company_reports
         role_name: Name of the role
         company_name: Name of the company
         
@@ -314,86 +288,27 @@ def create_role_report_pdf(reports, role_name, company_name):
     """
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter)
-    styles = getSampleStyleSheet()
     elements = []
     
     # Title
-    title_style = ParagraphStyle(
-        'Title',
-        parent=styles['Heading1'],
-        fontSize=16,
-        alignment=1,
-        spaceAfter=12
-    )
-    elements.append(Paragraph(f"{role_name} Reports - {company_name}", title_style))
+    elements.append(Paragraph(f"{_markup(role_name)} Reports - {_markup(company_name)}", _TITLE_STYLE))
     elements.append(Spacer(1, 12))
     
     # Date range
     if reports:
-        date_style = ParagraphStyle(
-            'DateRange',
-            parent=styles['Normal'],
-            fontSize=10,
-            alignment=1,
-            textColor=colors.gray
-        )
-        min_date = min(report[4] for report in reports).strftime('%d %b %Y')
-        max_date = max(report[4] for report in reports).strftime('%d %b %Y')
-        elements.append(Paragraph(f"Period: {min_date} to {max_date}", date_style))
+        period = _period(*_date_span(report[4] for report in reports))
+        elements.append(Paragraph(f"Period: {period}", _DATERANGE_STYLE))
         elements.append(Spacer(1, 20))
     
-    # Group reports by employee and branch
-    reports_by_employee = {}
-    for report in reports:
-        employee_name = report[1]
-        branch_name = report[3]
-        
-        key = f"{employee_name} ({branch_name})"
-        if key not in reports_by_employee:
-            reports_by_employee[key] = []
-        
-        reports_by_employee[key].append(report)
-    
-    # Add each employee's reports
-    for employee, emp_reports in reports_by_employee.items():
-        # Employee header
-        emp_style = ParagraphStyle(
-            'Employee',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceAfter=10
-        )
-        elements.append(Paragraph(employee, emp_style))
-        
-        # Group by date
-        emp_reports_by_date = {}
-        for report in emp_reports:
-            date_str = report[4].strftime('%Y-%m-%d')
-            if date_str not in emp_reports_by_date:
-                emp_reports_by_date[date_str] = report
-        
-        # Add each report
-        for date_str, report in sorted(emp_reports_by_date.items(), reverse=True):
-            # Date
-            date_style = ParagraphStyle(
-                'Date',
-                parent=styles['Normal'],
-                fontSize=11,
-                textColor=colors.blue
-            )
-            elements.append(Paragraph(report[4].strftime('%A, %d %b %Y'), date_style))
-            
-            # Report text
-            text_style = ParagraphStyle(
-                'ReportText',
-                parent=styles['Normal'],
-                fontSize=10,
-                leftIndent=10
-            )
-            elements.append(Paragraph(report[5], text_style))
-            elements.append(Spacer(1, 10))
-        
-        elements.append(Spacer(1, 15))
+    # Add each employee's reports; rows arrive grouped by branch and employee,
+    # and are grouped here on the employee ID since two employees can share a name
+    for (_, employee_name, branch_name), emp_reports in groupby(reports, key=itemgetter(7, 1, 3)):
+        # Employee header and the employee's reports
+        elements.extend((
+            Paragraph(_markup(f"{employee_name} ({branch_name})"), _SECTION_STYLE),
+            _report_table(((report[4], report[5]) for report in emp_reports), doc.width),
+            Spacer(1, 15)
+        ))
     
     # Build PDF
     doc.build(elements)
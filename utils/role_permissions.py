@@ -12,63 +12,119 @@ class RolePermissions:
     @staticmethod
     def get_role_level(role_name):
         """Convert role name to role level."""
-        role_map = {
-            "Manager": RolePermissions.MANAGER,
-            "Asst. Manager": RolePermissions.ASST_MANAGER,
-            "General Employee": RolePermissions.GENERAL_EMPLOYEE
-        }
-        return role_map.get(role_name, RolePermissions.GENERAL_EMPLOYEE)
+        return _NAME_TO_LEVEL.get(role_name, _GENERAL_EMPLOYEE)
     
     @staticmethod
     def get_role_name(role_level):
         """Convert role level to role name."""
-        role_map = {
-            RolePermissions.MANAGER: "Manager",
-            RolePermissions.ASST_MANAGER: "Asst. Manager",
-            RolePermissions.GENERAL_EMPLOYEE: "General Employee"
-        }
-        return role_map.get(role_level, "General Employee")
+        return _LEVEL_TO_NAME.get(role_level, "General Employee")
     
     @staticmethod
     def can_create_employees(user_role_level):
         """Check if the role can create employee accounts."""
-        return user_role_level <= RolePermissions.ASST_MANAGER  # Manager and Asst. Manager can create
+        return user_role_level <= _ASST_MANAGER  # Manager and Asst. Manager can create
+    
+    # The checks below read one bit of a mask for the standard levels 1 to 3.
+    # Any other level, such as a custom role's, is answered by the same rule
+    # evaluated directly, so every level gets a True or False answer.
     
     @staticmethod
     def can_assign_tasks_to(user_role_level, target_role_level):
         """Check if user role can assign tasks to target role."""
-        if user_role_level == RolePermissions.MANAGER:
-            # Manager can assign to Asst. Manager and General Employee
-            return target_role_level >= RolePermissions.ASST_MANAGER
-        elif user_role_level == RolePermissions.ASST_MANAGER:
-            # Asst. Manager can only assign to General Employee
-            return target_role_level == RolePermissions.GENERAL_EMPLOYEE
-        else:
-            # General Employee cannot assign tasks
-            return False
+        if user_role_level in _LEVELS and target_role_level in _LEVELS:
+            return bool(_CAN_ASSIGN_TASKS >> _pair_bit(user_role_level, target_role_level) & 1)
+        return _can_assign_by_order(user_role_level, target_role_level)
     
     @staticmethod
     def can_view_reports_of(user_role_level, target_role_level):
         """Check if user role can view reports from target role."""
-        if user_role_level == RolePermissions.MANAGER:
-            # Manager can view all reports in their branch
-            return True
-        elif user_role_level == RolePermissions.ASST_MANAGER:
-            # Asst. Manager can view their own and General Employee reports
-            return target_role_level >= RolePermissions.ASST_MANAGER
-        else:
-            # General Employee can only view their own reports
-            return user_role_level == target_role_level
+        if user_role_level in _LEVELS and target_role_level in _LEVELS:
+            return bool(_CAN_VIEW_REPORTS >> _pair_bit(user_role_level, target_role_level) & 1)
+        return _can_view_by_order(user_role_level, target_role_level)
     
     @staticmethod
     def can_deactivate_role(user_role_level, target_role_level):
         """Check if user role can deactivate/reactivate target role."""
-        if user_role_level == RolePermissions.MANAGER:
-            # Manager can deactivate Asst. Manager and General Employee
-            return target_role_level > user_role_level
-        elif user_role_level == RolePermissions.ASST_MANAGER:
-            # Asst. Manager can only deactivate General Employees
-            return target_role_level == RolePermissions.GENERAL_EMPLOYEE
-        else:
-            # General Employee cannot deactivate anyone
-            return False
+        if user_role_level in _LEVELS and target_role_level in _LEVELS:
+            return bool(_CAN_DEACTIVATE >> _pair_bit(user_role_level, target_role_level) & 1)
+        return _can_deactivate_by_order(user_role_level, target_role_level)
+
+# Role levels bound at module level, so the checks above read module globals
+# instead of looking up attributes on the class
+_MANAGER = RolePermissions.MANAGER
+_ASST_MANAGER = RolePermissions.ASST_MANAGER
+_GENERAL_EMPLOYEE = RolePermissions.GENERAL_EMPLOYEE
+
+# Role names and levels, built once
+_NAME_TO_LEVEL = {
+    "Manager": _MANAGER,
+    "Asst. Manager": _ASST_MANAGER,
+    "General Employee": _GENERAL_EMPLOYEE
+}
+_LEVEL_TO_NAME = {level: name for name, level in _NAME_TO_LEVEL.items()}
+
+# Levels covered by the permission masks; custom role levels outside this set
+# are checked against the rules below directly
+_LEVELS = frozenset(_LEVEL_TO_NAME)
+
+# Permission rules by role order. The masks are built from these, so they
+# are the only place each rule is written down.
+
+def _can_assign_by_order(user_role_level, target_role_level):
+    """Whether a user role level can assign tasks to a target role level."""
+    if user_role_level == _MANAGER:
+        # Manager can assign to Asst. Manager and General Employee
+        return target_role_level >= _ASST_MANAGER
+    elif user_role_level == _ASST_MANAGER:
+        # Asst. Manager can only assign to General Employee
+        return target_role_level == _GENERAL_EMPLOYEE
+    else:
+        # General Employee cannot assign tasks
+        return False
+
+def _can_view_by_order(user_role_level, target_role_level):
+    """Whether a user role level can view reports of a target role level."""
+    if user_role_level == _MANAGER:
+        # Manager can view all reports in their branch
+        return True
+    elif user_role_level == _ASST_MANAGER:
+        # Asst. Manager can view their own and General Employee reports
+        return target_role_level >= _ASST_MANAGER
+    else:
+        # General Employee can only view their own reports
+        return user_role_level == target_role_level
+
+def _can_deactivate_by_order(user_role_level, target_role_level):
+    """Whether a user role level can deactivate a target role level."""
+    if user_role_level == _MANAGER:
+        # Manager can deactivate Asst. Manager and General Employee
+        return target_role_level > user_role_level
+    elif user_role_level == _ASST_MANAGER:
+        # Asst. Manager can only deactivate General Employees
+        return target_role_level == _GENERAL_EMPLOYEE
+    else:
+        # General Employee cannot deactivate anyone
+        return False
+
+def _pair_bit(user_role_level, target_role_level):
+    """Bit position of a (user, target) role level pair, both in _LEVELS.
+    
+    Only meaningful for those levels: level 0 would give a negative shift
+    and levels above 3 would read another pair's bit, so the checks test
+    membership in _LEVELS first.
+    """
+    return (user_role_level - 1) * 3 + (target_role_level - 1)
+
+def _mask(rule):
+    """Bitmask with the bit of each (user, target) pair of _LEVELS set if rule permits it."""
+    return sum(
+        1 << _pair_bit(user, target)
+        for user in _LEVELS
+        for target in _LEVELS
+        if rule(user, target)
+    )
+
+# One bit per (user_role_level, target_role_level) pair of the standard levels
+_CAN_ASSIGN_TASKS = _mask(_can_assign_by_order)
+_CAN_VIEW_REPORTS = _mask(_can_view_by_order)
+_CAN_DEACTIVATE = _mask(_can_deactivate_by_order)